@@ -32,7 +32,8 @@ import handlers
 # ─── Logging ─────────────────────────────────────────────────────────────────
 
 logging.basicConfig(
-    level=getattr(logging, LOG_LEVEL.upper(), logging.INFO),
+    # LOG_LEVEL is already validated and upper-cased by config
+    level=logging.getLevelNamesMapping().get(LOG_LEVEL, logging.INFO),
     format="%(asctime)s [%(name)s] %(levelname)s: %(message)s",
     datefmt="%Y-%m-%d %H:%M:%S",
 )
@@ -107,7 +108,13 @@ async def main():
 
     log.info("Bot is running. Press Ctrl+C to stop.")
     try:
-        await dp.start_polling(bot, allowed_updates=["message", "callback_query"])
+        # handle_as_tasks: each update runs in its own task, so a slow
+        # handler never delays the next getUpdates call
+        await dp.start_polling(
+            bot,
+            allowed_updates=["message", "callback_query"],
+            handle_as_tasks=True,
+        )
     finally:
         log.info("Shutting down…")
         await _notify_owner(bot, "🔴 *MikroBot shutting down…*")
@@ -115,6 +122,7 @@ async def main():
         await monitor.stop()
         await watchdog.stop()
         await health.stop()
+        await rm.flush()
         await bot.session.close()
 
 
@@ -27,10 +27,11 @@ except ImportError:
 
 log = logging.getLogger("Config")
 
+_PLACEHOLDERS = frozenset({"", "PUT_TOKEN_HERE", "your_token_here", "change_me"})
+
 
 def _require_env(key: str, hint: str = "") -> str:
     val = os.environ.get(key, "").strip()
-    _PLACEHOLDERS = {"", "PUT_TOKEN_HERE", "your_token_here", "change_me"}
     if val in _PLACEHOLDERS:
         msg = (
             f"\n{'='*60}\n"
@@ -15,45 +15,61 @@ Response types:
   !fatal = fatal error (connection will close)
 """
 
-import struct
 import hashlib
+import json
+from enum import IntEnum
 
+try:
+    import orjson as _orjson
+except ImportError:  # optional speed-up; stdlib json is the fallback
+    _orjson = None
 
 # ─── Length Encoding ──────────────────────────────────────────────────────────
 
+# Single-byte prefixes for the (very common) words shorter than 128 bytes
+_SHORT_LEN = tuple(bytes((i,)) for i in range(0x80))
+
+
 def encode_length(length: int) -> bytes:
     if length < 0x80:
-        return struct.pack("B", length)
+        return _SHORT_LEN[length]
     elif length < 0x4000:
-        return struct.pack(">H", length | 0x8000)
+        return (length | 0x8000).to_bytes(2, "big")
     elif length < 0x200000:
-        b = struct.pack(">I", length | 0xC00000)
-        return b[1:]  # 3 bytes
+        return (length | 0xC00000).to_bytes(3, "big")
     elif length < 0x10000000:
-        return struct.pack(">I", length | 0xE0000000)
+        return (length | 0xE0000000).to_bytes(4, "big")
     else:
-        return b"\xF0" + struct.pack(">I", length)
+        return b"\xF0" + length.to_bytes(4, "big")
 
 
-def decode_length(data: bytes, offset: int) -> tuple[int, int]:
-    """Returns (length, new_offset)."""
-    b = data[offset]
+def _len_prefix(b: int) -> tuple[int, int]:
+    """(prefix size, value mask) for a length prefix starting with byte b."""
     if b < 0x80:
-        return b, offset + 1
+        return 1, 0x7F
     elif b < 0xC0:
-        val = struct.unpack(">H", data[offset:offset + 2])[0] & 0x3FFF
-        return val, offset + 2
+        return 2, 0x3FFF
     elif b < 0xE0:
-        # 3 bytes – pad to 4
-        raw = b"\x00" + data[offset:offset + 3]
-        val = struct.unpack(">I", raw)[0] & 0x1FFFFF
-        return val, offset + 3
+        return 3, 0x1FFFFF
     elif b < 0xF0:
-        val = struct.unpack(">I", data[offset:offset + 4])[0] & 0x0FFFFFFF
-        return val, offset + 4
-    else:
-        val = struct.unpack(">I", data[offset + 1:offset + 5])[0]
-        return val, offset + 5
+        return 4, 0x0FFFFFFF
+    return 5, 0xFFFFFFFF
+
+
+# First byte -> (prefix size, mask); replaces the per-word if/elif ladder
+_LEN_TABLE = tuple(_len_prefix(b) for b in range(256))
+
+
+def decode_length(data: bytes, offset: int) -> tuple[int, int]:
+    """Returns (length, new_offset). Raises BufferError on a truncated prefix."""
+    b = data[offset]
+    if b < 0x80:
+        return b, offset + 1  # single-byte lengths dominate – skip the table
+    nb, mask = _LEN_TABLE[b]
+    end = offset + nb
+    if end > len(data):
+        raise BufferError("Incomplete length prefix")
+    return int.from_bytes(data[offset:end], "big") & mask, end
 
 
 # ─── Word / Sentence Encoding ─────────────────────────────────────────────────
@@ -63,31 +79,103 @@ def encode_word(word: str) -> bytes:
     return encode_length(len(data)) + data
 
 
+# Fixed words sent on every login / poll cycle, encoded once at import.
+# Safe to share: the encoded form of a given string never changes.
+_COMMON_WORDS = {
+    w: encode_word(w)
+    for w in (
+        "/login",
+        "/cancel",
+        "/system/resource/print",
+        "/interface/print",
+        "/ip/dhcp-server/lease/print",
+        "/log/print",
+        "=follow=",
+        "=once=",
+    )
+}
+
+
 def build_sentence(words: list[str]) -> bytes:
-    return b"".join(encode_word(w) for w in words) + b"\x00"
+    common = _COMMON_WORDS.get
+    parts = [common(w) or encode_word(w) for w in words]
+    parts.append(b"\x00")
+    return b"".join(parts)
 
 
 # ─── Sentence Decoding ────────────────────────────────────────────────────────
 
-def decode_sentence(data: bytes, offset: int = 0) -> tuple[list[str], int]:
+def _decode_word(raw: bytes | bytearray | memoryview) -> str:
+    # str() decodes straight from the buffer – no intermediate bytes copy.
+    # Strict first: words are almost always valid UTF-8 (mostly ASCII).
+    try:
+        return str(raw, "utf-8")
+    except UnicodeDecodeError:
+        return str(raw, "utf-8", "replace")
+
+
+def decode_sentence(data: bytes | bytearray | memoryview, offset: int = 0) -> tuple[list[str], int]:
     """
-    Decode one sentence from a byte buffer.
+    Decode one sentence from a byte buffer (bytes, bytearray or memoryview).
     Returns (words, new_offset). words is empty list if no data yet.
+    Raises BufferError if the sentence is not yet complete.
     """
     words = []
-    while offset < len(data):
-        if offset >= len(data):
-            break
+    end = len(data)
+    if offset >= end:
+        return words, offset
+    while offset < end:
         length, offset = decode_length(data, offset)
         if length == 0:
-            break  # end of sentence
-        if offset + length > len(data):
+            return words, offset  # end of sentence
+        if offset + length > end:
             # incomplete – caller must buffer
             raise BufferError("Incomplete sentence data")
-        word = data[offset:offset + length].decode("utf-8", errors="replace")
-        words.append(word)
+        words.append(_decode_word(data[offset:offset + length]))
         offset += length
-    return words, offset
+    raise BufferError("Incomplete sentence data")
+
+
+def decode_sentences(data: bytes | bytearray | memoryview, offset: int = 0) -> tuple[list[list[str]], int]:
+    """
+    Decode every complete sentence in a byte buffer in a single pass.
+    Returns (sentences, new_offset) where new_offset is the start of the
+    trailing incomplete sentence — the caller keeps data[new_offset:].
+    Empty sentences (stray zero words) are skipped.
+    """
+    sentences: list[list[str]] = []
+    words: list[str] = []
+    end = len(data)
+    pos = offset
+    try:
+        while pos < end:
+            length, pos = decode_length(data, pos)
+            if length == 0:
+                if words:
+                    sentences.append(words)
+                    words = []
+                offset = pos
+                continue
+            nxt = pos + length
+            if nxt > end:
+                break  # incomplete word – wait for more data
+            words.append(_decode_word(data[pos:nxt]))
+            pos = nxt
+    except BufferError:
+        pass  # length prefix split across reads
+    return sentences, offset
+
+
+class Reply(IntEnum):
+    """Response type as a small int, so dispatch compares ints, not strings."""
+    RE = 0
+    DONE = 1
+    TRAP = 2
+    FATAL = 3
+    UNKNOWN = -1
+
+
+_REPLY_KINDS = {"!re": Reply.RE, "!done": Reply.DONE, "!trap": Reply.TRAP, "!fatal": Reply.FATAL}
 
 
 def parse_response(words: list[str]) -> dict:
@@ -97,28 +185,28 @@ def parse_response(words: list[str]) -> dict:
     Returns:
         {
             "type":  "!re" | "!done" | "!trap" | "!fatal",
+            "kind":  Reply matching "type" (Reply.UNKNOWN for anything else),
             "tag":   int | None,
             "attrs": {key: value, ...},
         }
     """
-    result = {"type": None, "tag": None, "attrs": {}}
+    # =key=value words – built by dict() in C rather than item-by-item
+    attrs = dict(w[1:].partition("=")[::2] for w in words if w[:1] == "=")
+    result = {"type": None, "kind": Reply.UNKNOWN, "tag": None, "attrs": attrs}
     for word in words:
-        if word.startswith("!"):
-            result["type"] = word
-        elif word.startswith(".tag="):
-            try:
-                result["tag"] = int(word[5:])
-            except ValueError:
-                result["tag"] = word[5:]
-        elif word.startswith("="):
-            # =key=value
-            eq2 = word.index("=", 1)
-            key = word[1:eq2]
-            value = word[eq2 + 1:]
-            result["attrs"][key] = value
-        elif word.startswith("?"):
-            # query word – store as-is
-            result["attrs"][word] = True
+        match word[:1]:
+            case "!":
+                result["type"] = word
+                result["kind"] = _REPLY_KINDS.get(word, Reply.UNKNOWN)
+            case ".":
+                if word.startswith(".tag="):
+                    try:
+                        result["tag"] = int(word[5:])
+                    except ValueError:
+                        result["tag"] = word[5:]
+            case "?":
+                # query word – store as-is
+                attrs[word] = True
     return result
 
 
@@ -130,9 +218,24 @@ def md5_challenge_response(password: str, challenge_hex: str) -> str:
       MD5( 0x00 + password_bytes + challenge_bytes )
     Returns lowercase hex string.
     """
-    challenge_bytes = bytes.fromhex(challenge_hex)
-    h = hashlib.md5()
-    h.update(b"\x00")
-    h.update(password.encode("utf-8"))
-    h.update(challenge_bytes)
-    return h.hexdigest()
+    data = b"\x00" + password.encode("utf-8") + bytes.fromhex(challenge_hex)
+    return hashlib.md5(data).hexdigest()
+
+
+# ─── JSON Serialisation ───────────────────────────────────────────────────────
+
+def dumps(obj, indent: bool = False) -> str:
+    """
+    JSON-encode parsed router data (attr dicts, status payloads).
+    Uses orjson when installed, stdlib json otherwise.
+    """
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def dumpb(obj) -> bytes:
+    """Compact JSON as UTF-8 bytes, for writing straight to disk."""
+    if _orjson is not None:
+        return _orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
@@ -306,18 +306,15 @@ async def remove_firewall_protection(router) -> tuple[bool, str]:
     except Exception as e:
         return False, f"❌ Cannot list rules: {e}"
 
-    removed = 0
-    errors: list[str] = []
-    for r in rules:
-        if GUARD_TAG in (r.get("comment") or ""):
-            try:
-                await router.remove_firewall_rule(r[".id"])
-                removed += 1
-            except Exception as e:
-                errors.append(str(e))
-
-    if errors:
-        return False, f"⚠️ Removed {removed}, errors: {'; '.join(errors[:2])}"
+    ids = [r[".id"] for r in rules if GUARD_TAG in (r.get("comment") or "")]
+    try:
+        # Raises only if nothing was removed; a partial run returns its count
+        removed = await router.remove_firewall_rules(ids)
+    except Exception as e:
+        return False, f"❌ Cannot remove rules: {e}"
+
+    if removed < len(ids):
+        return False, f"⚠️ Removed {removed}, {len(ids) - removed} failed"
     return True, f"✅ Removed {removed} guard rule(s)"
 
 
@@ -354,15 +351,12 @@ async def purge_flood_leases(
         return 0
 
     mac_set = {m.upper() for m in sample_macs}
-    removed = 0
-    for lease in leases:
-        if removed >= max_remove:
-            break
-        mac = (lease.get("mac-address") or "").upper()
-        if mac in mac_set and lease.get("type", "dynamic") == "dynamic":
-            try:
-                await router.remove_dhcp_lease(lease[".id"])
-                removed += 1
-            except Exception:
-                pass
-    return removed
+    ids = [
+        lease[".id"] for lease in leases
+        if (lease.get("mac-address") or "").upper() in mac_set
+        and lease.get("type", "dynamic") == "dynamic"
+    ][:max_remove]
+    try:
+        return await router.remove_dhcp_leases(ids)
+    except Exception:
+        return 0
@@ -19,11 +19,12 @@ Docker healthcheck:
 """
 
 import asyncio
-import json
 import logging
 import time
 from aiohttp import web
 
+from .api_protocol import dumps
+
 log = logging.getLogger("HealthServer")
 
 _start_time = time.time()
@@ -90,7 +91,7 @@ class HealthServer:
             "timestamp": _iso_now(),
         }
         return web.Response(
-            text=json.dumps(payload, indent=2),
+            text=dumps(payload, indent=True),
             content_type="application/json",
             status=200 if status == "ok" else 503,
         )
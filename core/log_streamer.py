@@ -5,6 +5,11 @@ Uses /log/print follow=yes under the hood.
 CHANGES vs original:
   - asyncio.get_event_loop() replaced with asyncio.get_running_loop()
     (get_event_loop() is deprecated since Python 3.10)
+  - router.stream_logs() now yields time-windowed batches, so a partial
+    batch is sent on time even when the router goes quiet
+  - At most MAX_PENDING_SENDS batches wait on Telegram per stream; beyond
+    that no batch is taken, so a log flood can't pile up send tasks, and
+    batch_by_time stops reading the router stream once LOG_BUFFER_MAX rows wait
 """
 
 import asyncio
@@ -37,17 +42,30 @@ TOPIC_EMOJI = {
     "hotspot": "📡",
 }
 
-MAX_BATCH_SIZE = 10
-BATCH_TIMEOUT = 5.0
+MAX_MESSAGE_LEN = 4000  # headroom under Telegram's 4096-char limit
+MAX_PENDING_SENDS = 8   # queued batches per stream before no more are taken
+
+# Caps concurrent Telegram sends across all streams (avoids 429 flood limits)
+_SEND_LIMIT = asyncio.Semaphore(4)
 
 
 def _format_log_entry(entry: dict) -> str:
     time_ = entry.get("time", "")
     topics = entry.get("topics", "")
     message = entry.get("message", "")
-    topic_list = [t.strip() for t in topics.split(",")]
-    emoji = next((TOPIC_EMOJI[t] for t in topic_list if t in TOPIC_EMOJI), "📋")
-    return f"{emoji} `{time_}` [{topics}]\n   {message}"
+    return f"{_topic_emoji(topics)} `{time_}` [{topics}]\n   {message}"
+
+
+def _topic_emoji(topics: str) -> str:
+    # Fast path: most entries carry a single topic, no split needed
+    emoji = TOPIC_EMOJI.get(topics)
+    if emoji is not None:
+        return emoji
+    for t in topics.split(","):
+        emoji = TOPIC_EMOJI.get(t.strip())
+        if emoji is not None:
+            return emoji
+    return "📋"
 
 
 async def stream_logs_to_chat(
@@ -64,9 +82,16 @@ async def stream_logs_to_chat(
     if stop_event is None:
         stop_event = asyncio.Event()
 
-    batch: list[str] = []
-    loop = asyncio.get_running_loop()   # was: get_event_loop() — deprecated since 3.10
-    last_flush = loop.time()
+    # Batches are sent in background tasks so a slow Telegram call never
+    # stalls reading from the router. The lock keeps this chat's batches
+    # in order; the set holds strong refs so in-flight sends aren't GC'd.
+    send_lock = asyncio.Lock()
+    pending: set[asyncio.Task] = set()
+
+    def schedule_flush(lines: list[str]) -> None:
+        task = asyncio.create_task(_flush_ordered(send_lock, bot, chat_id, lines))
+        pending.add(task)
+        task.add_done_callback(pending.discard)
 
     try:
         await bot.send_message(
@@ -76,37 +101,53 @@ async def stream_logs_to_chat(
             parse_mode="Markdown",
         )
 
-        async for entry in router.stream_logs(topics=topics):
+        # The router batches entries by size/time window (see batch_by_time)
+        async for entries in router.stream_logs(topics=topics):
             if stop_event.is_set():
                 break
-
-            line = _format_log_entry(entry)
-            batch.append(line)
-
-            now = loop.time()
-            if len(batch) >= MAX_BATCH_SIZE or (now - last_flush) >= BATCH_TIMEOUT:
-                await _flush(bot, chat_id, batch)
-                batch = []
-                last_flush = now
+            if len(pending) >= MAX_PENDING_SENDS:
+                # Backpressure: let Telegram catch up; meanwhile up to
+                # LOG_BUFFER_MAX rows queue in batch_by_time and come back as
+                # full batches, after which it stops reading the router
+                await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            schedule_flush([_format_log_entry(e) for e in entries])
 
     except asyncio.CancelledError:
         pass
     except Exception as e:
         log.warning(f"Log stream error: {e}")
     finally:
-        if batch:
-            await _flush(bot, chat_id, batch)
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
         try:
             await bot.send_message(chat_id, "🔴 *Log stream stopped.*", parse_mode="Markdown")
         except Exception:
             pass
 
 
+async def _flush_ordered(lock: asyncio.Lock, bot: Bot, chat_id: int, lines: list[str]) -> None:
+    async with lock:
+        await _flush(bot, chat_id, lines)
+
+
 async def _flush(bot: Bot, chat_id: int, lines: list[str]) -> None:
-    text = "\n\n".join(lines)
-    if len(text) > 4000:
-        text = text[:4000] + "\n…"
+    # Take whole lines up to the budget instead of joining everything and
+    # slicing — bounds the allocation and never cuts a line's Markdown in half
+    parts: list[str] = []
+    size = 0
+    for line in lines:
+        size += len(line) + (2 if parts else 0)
+        if size > MAX_MESSAGE_LEN:
+            break
+        parts.append(line)
+    if len(parts) == len(lines):
+        text = "\n\n".join(parts)
+    elif parts:
+        text = "\n\n".join(parts) + "\n…"
+    else:
+        text = lines[0][:MAX_MESSAGE_LEN] + "\n…"
     try:
-        await bot.send_message(chat_id, text, parse_mode="Markdown")
+        async with _SEND_LIMIT:
+            await bot.send_message(chat_id, text, parse_mode="Markdown")
     except Exception as e:
         log.warning(f"Failed to send log batch: {e}")
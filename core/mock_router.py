@@ -4,53 +4,180 @@ Used when no real router is available (development / demo mode).
 """
 
 import asyncio
+import itertools
 import random
-import string
+import time
 from datetime import datetime, timedelta
 from typing import AsyncIterator
 
-from .router_base import RouterBase
+from .router_base import RouterBase, batch_by_time
+
+
+# Population for host octets — lets random.choices() draw a whole batch at once
+_HOST_OCTETS = range(2, 255)
+_WIFI_CHANNELS = ("1", "6", "11", "36", "48", "149")
+_MB = 1024 * 1024
+_TRAFFIC_DELTAS = range(1000, 100001)
+# /interface/print row layout (same key order RouterOS uses)
+_IFACE_KEYS = ("name", "type", "running", "disabled", "rx-byte", "tx-byte", "mac-address", "comment")
+_PING_TIMES = range(1, 51)
+_HOP_TIMES = range(1, 101)
+# 10% packet loss / hop timeout
+_LOSS = (True, False)
+_LOSS_WEIGHTS = (1, 9)
+_STREAM_BURST = 16
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+           "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
 
 
 def _rand_mac():
-    return ":".join(f"{random.randint(0, 255):02X}" for _ in range(6))
+    return random.randbytes(6).hex(":").upper()
 
 
 def _rand_ip(prefix="192.168.88"):
     return f"{prefix}.{random.randint(2, 254)}"
 
 
+def _rand_ips(n: int, prefix="192.168.88") -> list[str]:
+    """n random host addresses under prefix, from one batched draw."""
+    prefix += "."
+    return [prefix + str(octet) for octet in random.choices(_HOST_OCTETS, k=n)]
+
+
+def _log_time(t: datetime) -> str:
+    """RouterOS log timestamp ("Jan/15 08:00:00") without strftime's locale path."""
+    return f"{_MONTHS[t.month - 1]}/{t.day:02d} {t.hour:02d}:{t.minute:02d}:{t.second:02d}"
+
+
+# Per-topic log message factories; random parts are generated only when picked
+_LOG_TEMPLATES = {
+    "system": (lambda: "router rebooted", lambda: "configuration changed", lambda: "user logged in"),
+    "info": (lambda: "interface ether1 link up", lambda: "DHCP pool almost full"),
+    "warning": (lambda: "high CPU load detected", lambda: "memory usage above 80%"),
+    "error": (lambda: "failed to connect to NTP server", lambda: "OSPF neighbor lost"),
+    "firewall": (lambda: f"forward: in:ether1 out:ether2, src-mac {_rand_mac()}, proto TCP",
+                 lambda: f"input drop: src-ip {_rand_ip('185.220')}"),
+    "dhcp": (lambda: f"assigned {_rand_ip()} to {_rand_mac()}", lambda: "lease renewed"),
+    "wireless": (lambda: f"client {_rand_mac()} connected", lambda: f"client {_rand_mac()} disconnected"),
+}
+_DEFAULT_LOG_TEMPLATES = (lambda: "event occurred",)
+
+
+def _index(key: str, rows: list[dict]) -> dict[str, dict]:
+    """Key mock records by id/name so lookups and removals are O(1)."""
+    return {r[key]: r for r in rows}
+
+
 class MockRouter(RouterBase):
 
+    # ─── Static payloads (built once at import, shared by all instances) ──────
+    # Getters hand out fresh copies of every row, so callers may mutate them
+
+    # Constant half of /system/resource; the live fields are merged in per call
+    _SYSTEM_RESOURCE = {
+        "version": "7.12.1 (stable)",
+        "build-time": "Jan/15/2025 08:00:00",
+        "total-memory": str(256 * 1024 * 1024),
+        "total-hdd-space": str(128 * 1024 * 1024),
+        "board-name": "RB4011iGS+",
+        "architecture-name": "arm64",
+        "cpu": "ARM Cortex-A57",
+        "cpu-count": "4",
+        "cpu-frequency": "1400",
+    }
+    _ROUTERBOARD = {
+        "routerboard": "true",
+        "board-name": "RB4011iGS+",
+        "model": "RB4011iGS+",
+        "serial-number": "DEMO0001",
+        "firmware-type": "ipq40xx",
+        "factory-firmware": "7.1.5",
+        "current-firmware": "7.12.1",
+        "upgrade-firmware": "7.12.1",
+    }
+    _IP_ADDRESSES = (
+        {".id": "*1", "address": "10.0.0.2/24", "interface": "ether1", "network": "10.0.0.0", "dynamic": "false"},
+        {".id": "*2", "address": "192.168.88.1/24", "interface": "ether2", "network": "192.168.88.0", "dynamic": "false"},
+        {".id": "*3", "address": "192.168.89.1/24", "interface": "wlan1", "network": "192.168.89.0", "dynamic": "false"},
+    )
+    _DHCP_SERVERS = (
+        {"name": "dhcp1", "interface": "ether2", "address-pool": "dhcp_pool",
+         "lease-time": "1d", "disabled": "false"},
+    )
+    _WIRELESS_INTERFACES = (
+        {"name": "wlan1", "ssid": "HomeNetwork", "frequency": "2437", "band": "2ghz-b/g/n",
+         "security-profile": "default", "disabled": "false", "running": "true",
+         "tx-power": "20", "channel-width": "20/40MHz"},
+        {"name": "wlan2", "ssid": "HomeNetwork_5G", "frequency": "5180", "band": "5ghz-n/ac",
+         "security-profile": "default", "disabled": "false", "running": "true",
+         "tx-power": "20", "channel-width": "20/40/80MHz"},
+    )
+    _WIRELESS_SECURITY_PROFILES = (
+        {"name": "default", "mode": "dynamic-keys", "authentication-types": "wpa2-psk",
+         "wpa2-pre-shared-key": "supersecret123", "group-key-update": "5m"},
+    )
+    _PPPOE_SERVERS = ({"name": "pppoe-in1", "interface": "ether1", "enabled": "yes"},)
+    _L2TP_SERVER = {"enabled": "yes", "authentication": "chap,mschap1,mschap2"}
+    _OVPN_SERVER = {"enabled": "no", "port": "1194"}
+    _PPTP_SERVER = {"enabled": "no"}
+    _ARP = (
+        {"address": "192.168.88.10", "mac-address": "AA:11:BB:22:CC:33", "interface": "ether2", "complete": "yes"},
+        {"address": "192.168.88.11", "mac-address": "DD:44:EE:55:FF:66", "interface": "ether2", "complete": "yes"},
+    )
+    _DNS_SETTINGS = {"servers": "1.1.1.1,8.8.8.8", "allow-remote-requests": "yes",
+                     "cache-max-ttl": "1w", "cache-size": "2048"}
+    _DNS_CACHE = (
+        {"name": "example.com", "address": "93.184.216.34", "ttl": "3600", "type": "A"},
+        {"name": "google.com", "address": "142.250.185.78", "ttl": "300", "type": "A"},
+    )
+    _EXPORT_CONFIG = (
+        "# RouterOS 7.12.1\n"
+        "# Software ID = DEMO-0001\n"
+        "/system identity set name=MikroBot-Demo\n"
+        "/ip address add address=192.168.88.1/24 interface=ether2\n"
+        "/ip dhcp-server add interface=ether2 name=dhcp1\n"
+        "/ip firewall nat add chain=srcnat out-interface=ether1 action=masquerade\n"
+    )
+    _BACKUP_FILE = b"# Mock backup file\n# This is a demo\n/system identity set name=Demo\n"
+    _NTP_CLIENT = {"enabled": "yes", "primary-ntp": "0.pool.ntp.org",
+                   "secondary-ntp": "1.pool.ntp.org", "server-dns-names": "", "mode": "unicast"}
+
     def __init__(self):
         self._connected = True
-        self._uptime_start = datetime.now() - timedelta(days=2, hours=4, minutes=33)
-        self._interfaces = [
-            {"name": "ether1", "type": "ether", "running": "true", "disabled": "false",
-             "rx-byte": str(random.randint(10**8, 10**10)), "tx-byte": str(random.randint(10**8, 10**10)),
+        # Source of unique ".id"s for added records (seed data uses *1..*5)
+        self._id_seq = itertools.count(100)
+        # Pretend boot was 2d 04:33 ago; monotonic so clock changes don't skew it
+        self._uptime_start = time.monotonic() - timedelta(days=2, hours=4, minutes=33).total_seconds()
+        # (elapsed minutes, formatted uptime) – the string only changes once a minute
+        self._uptime_cache: tuple[int, str] = (-1, "")
+        self._interfaces = _index("name", [
+            {"name": "ether1", "type": "ether", "running": True, "disabled": False,
              "mac-address": "AA:BB:CC:DD:EE:01", "comment": "WAN"},
-            {"name": "ether2", "type": "ether", "running": "true", "disabled": "false",
-             "rx-byte": str(random.randint(10**8, 10**10)), "tx-byte": str(random.randint(10**8, 10**10)),
+            {"name": "ether2", "type": "ether", "running": True, "disabled": False,
              "mac-address": "AA:BB:CC:DD:EE:02", "comment": "LAN"},
-            {"name": "wlan1", "type": "wlan", "running": "true", "disabled": "false",
-             "rx-byte": str(random.randint(10**7, 10**9)), "tx-byte": str(random.randint(10**7, 10**9)),
+            {"name": "wlan1", "type": "wlan", "running": True, "disabled": False,
              "mac-address": "AA:BB:CC:DD:EE:03", "comment": "WiFi 2.4GHz"},
-            {"name": "wlan2", "type": "wlan", "running": "true", "disabled": "false",
-             "rx-byte": str(random.randint(10**7, 10**9)), "tx-byte": str(random.randint(10**7, 10**9)),
+            {"name": "wlan2", "type": "wlan", "running": True, "disabled": False,
              "mac-address": "AA:BB:CC:DD:EE:04", "comment": "WiFi 5GHz"},
-        ]
-        self._firewall_filter = [
+        ])
+        # rx/tx byte counters as int columns, positionally aligned with
+        # _interfaces (which never gains or loses entries)
+        self._iface_rx = [random.randint(10**8, 10**10), random.randint(10**8, 10**10),
+                          random.randint(10**7, 10**9), random.randint(10**7, 10**9)]
+        self._iface_tx = [random.randint(10**8, 10**10), random.randint(10**8, 10**10),
+                          random.randint(10**7, 10**9), random.randint(10**7, 10**9)]
+        self._firewall_filter = _index(".id", [
             {".id": "*1", "chain": "input", "protocol": "icmp", "action": "accept", "comment": "Allow ping", "disabled": "false", "bytes": "1024"},
             {".id": "*2", "chain": "input", "protocol": "tcp", "dst-port": "8291", "action": "accept", "comment": "Allow WinBox", "disabled": "false", "bytes": "512"},
             {".id": "*3", "chain": "forward", "connection-state": "established,related", "action": "accept", "comment": "Allow established", "disabled": "false", "bytes": "50000"},
             {".id": "*4", "chain": "forward", "connection-state": "invalid", "action": "drop", "comment": "Drop invalid", "disabled": "false", "bytes": "128"},
             {".id": "*5", "chain": "input", "action": "drop", "comment": "Drop all input", "disabled": "false", "bytes": "256"},
-        ]
+        ])
         self._firewall_nat = [
             {".id": "*1", "chain": "srcnat", "out-interface": "ether1", "action": "masquerade",
              "comment": "Masquerade WAN", "disabled": "false", "bytes": "100000"},
         ]
-        self._dhcp_leases = [
+        self._dhcp_leases = _index(".id", [
             {"address": "192.168.88.10", "mac-address": "AA:11:BB:22:CC:33",
              "host-name": "desktop-pc", "type": "static", "status": "bound",
              "expires-after": "23:59:00", ".id": "*1"},
@@ -60,33 +187,40 @@ class MockRouter(RouterBase):
             {"address": "192.168.88.12", "mac-address": "11:22:33:44:55:66",
              "host-name": "phone", "type": "dynamic", "status": "bound",
              "expires-after": "05:00:00", ".id": "*3"},
-        ]
-        self._address_list = [
+        ])
+        self._address_list = _index(".id", [
             {".id": "*1", "list": "blacklist", "address": "185.220.101.1", "comment": "TOR exit"},
             {".id": "*2", "list": "blacklist", "address": "45.142.212.0/24", "comment": "Known attacker"},
             {".id": "*3", "list": "whitelist", "address": "192.168.88.0/24", "comment": "LAN"},
-        ]
-        self._vpn_secrets = [
+        ])
+        # list name -> {.id -> entry}; kept in step with _address_list
+        self._address_list_by_name: dict[str, dict[str, dict]] = {}
+        for entry in self._address_list.values():
+            self._address_list_by_name.setdefault(entry["list"], {})[entry[".id"]] = entry
+        self._vpn_secrets = _index(".id", [
             {".id": "*1", "name": "user1", "password": "pass1", "service": "any", "profile": "default"},
             {".id": "*2", "name": "user2", "password": "pass2", "service": "l2tp", "profile": "default"},
-        ]
-        self._routes = [
+        ])
+        self._routes = _index(".id", [
             {".id": "*1", "dst-address": "0.0.0.0/0", "gateway": "10.0.0.1", "distance": "1",
              "active": "true", "static": "true"},
             {".id": "*2", "dst-address": "192.168.88.0/24", "gateway": "ether2", "distance": "0",
              "active": "true", "static": "false"},
-        ]
-        self._files = [
+        ])
+        self._files = _index("name", [
             {"name": "backup.backup", "size": "48000", "creation-time": "2025-01-15 10:00:00", "type": "backup"},
             {"name": "flash/config.rsc", "size": "12000", "creation-time": "2025-01-10 08:30:00", "type": "script"},
-        ]
+        ])
         self._log_topics = ["system", "info", "warning", "error", "firewall", "dhcp", "wireless"]
-        self._wireless_clients = [
+        self._wireless_clients = _index("mac-address", [
             {"mac-address": "11:22:33:44:55:66", "interface": "wlan1", "signal-strength": "-65dBm",
              "tx-rate": "54Mbps", "rx-rate": "54Mbps", "uptime": "01:23:00", "comment": "phone"},
             {"mac-address": "AA:BB:CC:DD:EE:FF", "interface": "wlan2", "signal-strength": "-50dBm",
              "tx-rate": "300Mbps", "rx-rate": "300Mbps", "uptime": "03:45:00", "comment": "laptop"},
-        ]
+        ])
+
+    def _new_id(self) -> str:
+        return f"*{next(self._id_seq)}"
 
     # ─── Connection ───────────────────────────────────────────────────────────
 
@@ -103,40 +237,27 @@ class MockRouter(RouterBase):
     # ─── System ───────────────────────────────────────────────────────────────
 
     async def get_system_resource(self) -> dict:
-        uptime = datetime.now() - self._uptime_start
-        total_h = int(uptime.total_seconds() // 3600)
-        d, h = divmod(total_h, 24)
-        m = int((uptime.total_seconds() % 3600) // 60)
         return {
-            "uptime": f"{d}d{h:02d}:{m:02d}:00",
-            "version": "7.12.1 (stable)",
-            "build-time": "Jan/15/2025 08:00:00",
+            **self._SYSTEM_RESOURCE,
+            "uptime": self._uptime(),
             "cpu-load": str(random.randint(5, 45)),
-            "free-memory": str(random.randint(20, 80) * 1024 * 1024),
-            "total-memory": str(256 * 1024 * 1024),
-            "free-hdd-space": str(random.randint(10, 50) * 1024 * 1024),
-            "total-hdd-space": str(128 * 1024 * 1024),
-            "board-name": "RB4011iGS+",
-            "architecture-name": "arm64",
-            "cpu": "ARM Cortex-A57",
-            "cpu-count": "4",
-            "cpu-frequency": "1400",
+            "free-memory": str(random.randint(20, 80) * _MB),
+            "free-hdd-space": str(random.randint(10, 50) * _MB),
         }
 
+    def _uptime(self) -> str:
+        minutes = int(time.monotonic() - self._uptime_start) // 60
+        if minutes != self._uptime_cache[0]:
+            h, m = divmod(minutes, 60)
+            d, h = divmod(h, 24)
+            self._uptime_cache = (minutes, f"{d}d{h:02d}:{m:02d}:00")
+        return self._uptime_cache[1]
+
     async def get_system_identity(self) -> str:
         return "MikroBot-Demo"
 
     async def get_system_routerboard(self) -> dict:
-        return {
-            "routerboard": "true",
-            "board-name": "RB4011iGS+",
-            "model": "RB4011iGS+",
-            "serial-number": "DEMO0001",
-            "firmware-type": "ipq40xx",
-            "factory-firmware": "7.1.5",
-            "current-firmware": "7.12.1",
-            "upgrade-firmware": "7.12.1",
-        }
+        return dict(self._ROUTERBOARD)
 
     async def get_system_health(self) -> dict:
         return {
@@ -147,28 +268,42 @@ class MockRouter(RouterBase):
     async def reboot(self):
         self._connected = False
 
+    async def get_monitor_snapshot(self) -> dict:
+        return {
+            "resource": await self.get_system_resource(),
+            "interfaces": await self.get_interfaces(),
+            "leases": await self.get_dhcp_leases(),
+        }
+
     # ─── Interfaces ───────────────────────────────────────────────────────────
 
     async def get_interfaces(self) -> list[dict]:
-        ifaces = []
-        for i in self._interfaces:
-            iface = dict(i)
-            iface["rx-byte"] = str(int(i["rx-byte"]) + random.randint(1000, 100000))
-            iface["tx-byte"] = str(int(i["tx-byte"]) + random.randint(1000, 100000))
-            ifaces.append(iface)
-        return ifaces
+        # Counters advance column-wise from one batched draw of deltas
+        rx, tx = self._iface_rx, self._iface_tx
+        n = len(rx)
+        deltas = random.choices(_TRAFFIC_DELTAS, k=2 * n)
+        for k in range(n):
+            rx[k] += deltas[k]
+            tx[k] += deltas[n + k]
+        return [
+            dict(zip(_IFACE_KEYS, (
+                m["name"], m["type"], m["running"], m["disabled"],
+                str(r), str(t), m["mac-address"], m["comment"],
+            )))
+            for m, r, t in zip(self._interfaces.values(), rx, tx)
+        ]
 
     async def enable_interface(self, name: str):
-        for i in self._interfaces:
-            if i["name"] == name:
-                i["running"] = "true"
-                i["disabled"] = "false"
+        i = self._interfaces.get(name)
+        if i:
+            i["running"] = True
+            i["disabled"] = False
 
     async def disable_interface(self, name: str):
-        for i in self._interfaces:
-            if i["name"] == name:
-                i["running"] = "false"
-                i["disabled"] = "true"
+        i = self._interfaces.get(name)
+        if i:
+            i["running"] = False
+            i["disabled"] = True
 
     async def get_interface_traffic(self, name: str, duration: int = 5) -> dict:
         return {
@@ -182,14 +317,10 @@ class MockRouter(RouterBase):
     # ─── IP Addresses ─────────────────────────────────────────────────────────
 
     async def get_ip_addresses(self) -> list[dict]:
-        return [
-            {".id": "*1", "address": "10.0.0.2/24", "interface": "ether1", "network": "10.0.0.0", "dynamic": "false"},
-            {".id": "*2", "address": "192.168.88.1/24", "interface": "ether2", "network": "192.168.88.0", "dynamic": "false"},
-            {".id": "*3", "address": "192.168.89.1/24", "interface": "wlan1", "network": "192.168.89.0", "dynamic": "false"},
-        ]
+        return [dict(row) for row in self._IP_ADDRESSES]
 
     async def add_ip_address(self, address: str, interface: str) -> str:
-        return f"*{random.randint(10, 99)}"
+        return self._new_id()
 
     async def remove_ip_address(self, id_: str):
         pass
@@ -197,29 +328,29 @@ class MockRouter(RouterBase):
     # ─── Firewall ─────────────────────────────────────────────────────────────
 
     async def get_firewall_filter(self) -> list[dict]:
-        return list(self._firewall_filter)
+        return list(self._firewall_filter.values())
 
     async def add_firewall_filter(self, params: dict) -> str:
-        new_id = f"*{random.randint(100, 999)}"
+        new_id = self._new_id()
         rule = dict(params)
         rule[".id"] = new_id
         rule.setdefault("disabled", "false")
         rule.setdefault("bytes", "0")
-        self._firewall_filter.append(rule)
+        self._firewall_filter[new_id] = rule
         return new_id
 
     async def remove_firewall_rule(self, id_: str):
-        self._firewall_filter = [r for r in self._firewall_filter if r.get(".id") != id_]
+        self._firewall_filter.pop(id_, None)
 
     async def enable_firewall_rule(self, id_: str):
-        for r in self._firewall_filter:
-            if r.get(".id") == id_:
-                r["disabled"] = "false"
+        r = self._firewall_filter.get(id_)
+        if r:
+            r["disabled"] = "false"
 
     async def disable_firewall_rule(self, id_: str):
-        for r in self._firewall_filter:
-            if r.get(".id") == id_:
-                r["disabled"] = "true"
+        r = self._firewall_filter.get(id_)
+        if r:
+            r["disabled"] = "true"
 
     async def move_firewall_rule(self, id_: str, destination: int):
         pass  # No-op in mock
@@ -228,76 +359,74 @@ class MockRouter(RouterBase):
         return list(self._firewall_nat)
 
     async def add_firewall_nat(self, params: dict) -> str:
-        return f"*{random.randint(100, 999)}"
+        return self._new_id()
 
     async def get_firewall_mangle(self) -> list[dict]:
         return []
 
     async def get_address_list(self, list_name: str | None = None) -> list[dict]:
         if list_name:
-            return [e for e in self._address_list if e.get("list") == list_name]
-        return list(self._address_list)
+            return list(self._address_list_by_name.get(list_name, {}).values())
+        return list(self._address_list.values())
 
     async def add_address_list_entry(self, address: str, list_name: str, comment: str = "") -> str:
-        new_id = f"*{random.randint(100, 999)}"
-        self._address_list.append({".id": new_id, "list": list_name, "address": address, "comment": comment})
+        new_id = self._new_id()
+        entry = {".id": new_id, "list": list_name, "address": address, "comment": comment}
+        self._address_list[new_id] = entry
+        self._address_list_by_name.setdefault(list_name, {})[new_id] = entry
         return new_id
 
     async def remove_address_list_entry(self, id_: str):
-        self._address_list = [e for e in self._address_list if e.get(".id") != id_]
+        entry = self._address_list.pop(id_, None)
+        if entry:
+            members = self._address_list_by_name.get(entry["list"], {})
+            members.pop(id_, None)
+            if not members:
+                self._address_list_by_name.pop(entry["list"], None)
 
     async def get_connection_tracking(self) -> list[dict]:
+        n = random.randint(5, 20)
+        # One batched draw per column instead of three RNG calls per row
+        protos = random.choices(("tcp", "udp"), k=n)
         return [
-            {"src-address": _rand_ip(), "dst-address": _rand_ip("8.8"),
-             "protocol": random.choice(["tcp", "udp"]), "state": "established"}
-            for _ in range(random.randint(5, 20))
+            {"src-address": src, "dst-address": dst, "protocol": proto, "state": "established"}
+            for src, dst, proto in zip(_rand_ips(n), _rand_ips(n, "8.8"), protos)
         ]
 
     # ─── DHCP ─────────────────────────────────────────────────────────────────
 
     async def get_dhcp_server(self) -> list[dict]:
-        return [{"name": "dhcp1", "interface": "ether2", "address-pool": "dhcp_pool",
-                 "lease-time": "1d", "disabled": "false"}]
+        return [dict(row) for row in self._DHCP_SERVERS]
 
     async def get_dhcp_leases(self) -> list[dict]:
-        return list(self._dhcp_leases)
+        return list(self._dhcp_leases.values())
 
     async def add_dhcp_static_lease(self, mac: str, ip: str, comment: str = "") -> str:
-        new_id = f"*{random.randint(100, 999)}"
-        self._dhcp_leases.append({
+        new_id = self._new_id()
+        self._dhcp_leases[new_id] = {
             "address": ip, "mac-address": mac, "host-name": comment or "new-device",
             "type": "static", "status": "bound", "expires-after": "never", ".id": new_id,
-        })
+        }
         return new_id
 
     async def remove_dhcp_lease(self, id_: str):
-        self._dhcp_leases = [l for l in self._dhcp_leases if l.get(".id") != id_]
+        self._dhcp_leases.pop(id_, None)
 
     async def make_dhcp_lease_static(self, id_: str):
-        for l in self._dhcp_leases:
-            if l.get(".id") == id_:
-                l["type"] = "static"
+        l = self._dhcp_leases.get(id_)
+        if l:
+            l["type"] = "static"
 
     # ─── Wireless ─────────────────────────────────────────────────────────────
 
     async def get_wireless_interfaces(self) -> list[dict]:
-        return [
-            {"name": "wlan1", "ssid": "HomeNetwork", "frequency": "2437", "band": "2ghz-b/g/n",
-             "security-profile": "default", "disabled": "false", "running": "true",
-             "tx-power": "20", "channel-width": "20/40MHz"},
-            {"name": "wlan2", "ssid": "HomeNetwork_5G", "frequency": "5180", "band": "5ghz-n/ac",
-             "security-profile": "default", "disabled": "false", "running": "true",
-             "tx-power": "20", "channel-width": "20/40/80MHz"},
-        ]
+        return [dict(row) for row in self._WIRELESS_INTERFACES]
 
     async def get_wireless_registrations(self) -> list[dict]:
-        return list(self._wireless_clients)
+        return list(self._wireless_clients.values())
 
     async def get_wireless_security_profiles(self) -> list[dict]:
-        return [
-            {"name": "default", "mode": "dynamic-keys", "authentication-types": "wpa2-psk",
-             "wpa2-pre-shared-key": "supersecret123", "group-key-update": "5m"},
-        ]
+        return [dict(row) for row in self._WIRELESS_SECURITY_PROFILES]
 
     async def set_wireless_ssid(self, interface: str, ssid: str):
         pass
@@ -312,148 +441,134 @@ class MockRouter(RouterBase):
         pass
 
     async def disconnect_wireless_client(self, mac: str):
-        self._wireless_clients = [c for c in self._wireless_clients if c.get("mac-address") != mac]
+        self._wireless_clients.pop(mac, None)
 
     async def get_wireless_scan(self, interface: str) -> list[dict]:
+        n = random.randint(3, 8)
+        signals = random.choices(range(-80, -29), k=n)
+        channels = random.choices(_WIFI_CHANNELS, k=n)
         return [
-            {"ssid": f"Network-{i}", "bssid": _rand_mac(), "signal": str(random.randint(-80, -30)),
-             "channel": str(random.choice([1, 6, 11, 36, 48, 149])), "security": "WPA2"}
-            for i in range(random.randint(3, 8))
+            {"ssid": f"Network-{i}", "bssid": _rand_mac(), "signal": str(signal),
+             "channel": channel, "security": "WPA2"}
+            for i, (signal, channel) in enumerate(zip(signals, channels))
         ]
 
     # ─── VPN ──────────────────────────────────────────────────────────────────
 
     async def get_pppoe_server(self) -> list[dict]:
-        return [{"name": "pppoe-in1", "interface": "ether1", "enabled": "yes"}]
+        return [dict(row) for row in self._PPPOE_SERVERS]
 
     async def get_pppoe_active(self) -> list[dict]:
         return [{"name": "pppoe-user1", "address": "10.0.0.5", "caller-id": _rand_mac(), "uptime": "02:30:00"}]
 
     async def get_l2tp_server(self) -> dict:
-        return {"enabled": "yes", "authentication": "chap,mschap1,mschap2"}
+        return dict(self._L2TP_SERVER)
 
     async def get_ovpn_server(self) -> dict:
-        return {"enabled": "no", "port": "1194"}
+        return dict(self._OVPN_SERVER)
 
     async def get_pptp_server(self) -> dict:
-        return {"enabled": "no"}
+        return dict(self._PPTP_SERVER)
 
     async def get_vpn_secrets(self) -> list[dict]:
-        return list(self._vpn_secrets)
+        return list(self._vpn_secrets.values())
 
     async def add_vpn_secret(self, name: str, password: str, service: str = "any", profile: str = "default") -> str:
-        new_id = f"*{random.randint(100, 999)}"
-        self._vpn_secrets.append({".id": new_id, "name": name, "password": password,
-                                   "service": service, "profile": profile})
+        new_id = self._new_id()
+        self._vpn_secrets[new_id] = {".id": new_id, "name": name, "password": password,
+                                     "service": service, "profile": profile}
         return new_id
 
     async def remove_vpn_secret(self, id_: str):
-        self._vpn_secrets = [s for s in self._vpn_secrets if s.get(".id") != id_]
+        self._vpn_secrets.pop(id_, None)
 
     # ─── File System ──────────────────────────────────────────────────────────
 
     async def get_files(self) -> list[dict]:
-        return list(self._files)
+        return list(self._files.values())
 
     async def delete_file(self, name: str):
-        self._files = [f for f in self._files if f.get("name") != name]
+        self._files.pop(name, None)
 
     async def get_backup_file(self, name: str) -> bytes:
-        return b"# Mock backup file\n# This is a demo\n/system identity set name=Demo\n"
+        return self._BACKUP_FILE
 
     async def create_backup(self, name: str = "", password: str = "") -> str:
         fname = (name or "backup") + ".backup"
-        self._files.append({
+        self._files[fname] = {
             "name": fname, "size": str(random.randint(40000, 60000)),
             "creation-time": datetime.now().strftime("%b/%d/%Y %H:%M:%S"),
             "type": "backup",
-        })
+        }
         return fname
 
     async def export_config(self) -> str:
-        return (
-            "# RouterOS 7.12.1\n"
-            "# Software ID = DEMO-0001\n"
-            "/system identity set name=MikroBot-Demo\n"
-            "/ip address add address=192.168.88.1/24 interface=ether2\n"
-            "/ip dhcp-server add interface=ether2 name=dhcp1\n"
-            "/ip firewall nat add chain=srcnat out-interface=ether1 action=masquerade\n"
-        )
+        return self._EXPORT_CONFIG
 
     # ─── Logs ─────────────────────────────────────────────────────────────────
 
     async def get_logs(self, limit: int = 50, topics: str = "") -> list[dict]:
-        entries = []
-        base_time = datetime.now()
-        for i in range(min(limit, 30)):
-            t = base_time - timedelta(seconds=i * 30)
-            topic = random.choice(self._log_topics)
-            entries.append({
-                "time": t.strftime("%b/%d %H:%M:%S"),
+        # Oldest first, entries 30s apart, newest at "now"
+        n = min(limit, 30)
+        start = datetime.now() - timedelta(seconds=(n - 1) * 30)
+        return [
+            {
+                "time": _log_time(start + timedelta(seconds=i * 30)),
                 "topics": topic,
                 "message": self._fake_log_message(topic),
-            })
-        return list(reversed(entries))
+            }
+            for i, topic in enumerate(random.choices(self._log_topics, k=n))
+        ]
 
-    async def stream_logs(self, topics: str = "") -> AsyncIterator[dict]:
+    async def stream_logs(self, topics: str = "") -> AsyncIterator[list[dict]]:
+        async for batch in batch_by_time(self._log_source()):
+            yield batch
+
+    async def _log_source(self) -> AsyncIterator[dict]:
         while True:
-            await asyncio.sleep(random.uniform(2, 8))
-            topic = random.choice(self._log_topics)
-            yield {
-                "time": datetime.now().strftime("%b/%d %H:%M:%S"),
-                "topics": topic,
-                "message": self._fake_log_message(topic),
-            }
+            # Topics for a whole burst come from one batched draw
+            for topic in random.choices(self._log_topics, k=_STREAM_BURST):
+                await asyncio.sleep(random.uniform(2, 8))
+                yield {
+                    "time": _log_time(datetime.now()),
+                    "topics": topic,
+                    "message": self._fake_log_message(topic),
+                }
 
     @staticmethod
     def _fake_log_message(topic: str) -> str:
-        messages = {
-            "system": ["router rebooted", "configuration changed", "user logged in"],
-            "info": ["interface ether1 link up", "DHCP pool almost full"],
-            "warning": ["high CPU load detected", "memory usage above 80%"],
-            "error": ["failed to connect to NTP server", "OSPF neighbor lost"],
-            "firewall": [f"forward: in:ether1 out:ether2, src-mac {_rand_mac()}, proto TCP",
-                         f"input drop: src-ip {_rand_ip('185.220')}"],
-            "dhcp": [f"assigned {_rand_ip()} to {_rand_mac()}", "lease renewed"],
-            "wireless": [f"client {_rand_mac()} connected", f"client {_rand_mac()} disconnected"],
-        }
-        options = messages.get(topic, ["event occurred"])
-        return random.choice(options)
+        # Only the chosen template is called, so unused MACs/IPs are never built
+        return random.choice(_LOG_TEMPLATES.get(topic, _DEFAULT_LOG_TEMPLATES))()
 
     # ─── Routing ──────────────────────────────────────────────────────────────
 
     async def get_routes(self) -> list[dict]:
-        return list(self._routes)
+        return list(self._routes.values())
 
     async def add_route(self, dst_address: str, gateway: str, distance: int = 1) -> str:
-        new_id = f"*{random.randint(100, 999)}"
-        self._routes.append({".id": new_id, "dst-address": dst_address, "gateway": gateway,
-                              "distance": str(distance), "active": "true", "static": "true"})
+        new_id = self._new_id()
+        self._routes[new_id] = {".id": new_id, "dst-address": dst_address, "gateway": gateway,
+                                "distance": str(distance), "active": "true", "static": "true"}
         return new_id
 
     async def remove_route(self, id_: str):
-        self._routes = [r for r in self._routes if r.get(".id") != id_]
+        self._routes.pop(id_, None)
 
     # ─── ARP ──────────────────────────────────────────────────────────────────
 
     async def get_arp(self) -> list[dict]:
-        return [
-            {"address": "192.168.88.10", "mac-address": "AA:11:BB:22:CC:33", "interface": "ether2", "complete": "yes"},
-            {"address": "192.168.88.11", "mac-address": "DD:44:EE:55:FF:66", "interface": "ether2", "complete": "yes"},
-        ]
+        return [dict(row) for row in self._ARP]
 
     # ─── DNS ──────────────────────────────────────────────────────────────────
 
     async def get_dns_settings(self) -> dict:
-        return {"servers": "1.1.1.1,8.8.8.8", "allow-remote-requests": "yes",
-                "cache-max-ttl": "1w", "cache-size": "2048"}
+        return dict(self._DNS_SETTINGS)
 
     async def set_dns_servers(self, servers: list[str]):
         pass
 
     async def get_dns_cache(self) -> list[dict]:
-        return [{"name": "example.com", "address": "93.184.216.34", "ttl": "3600", "type": "A"},
-                {"name": "google.com", "address": "142.250.185.78", "ttl": "300", "type": "A"}]
+        return [dict(row) for row in self._DNS_CACHE]
 
     async def flush_dns_cache(self):
         pass
@@ -461,8 +576,7 @@ class MockRouter(RouterBase):
     # ─── NTP ──────────────────────────────────────────────────────────────────
 
     async def get_ntp_client(self) -> dict:
-        return {"enabled": "yes", "primary-ntp": "0.pool.ntp.org",
-                "secondary-ntp": "1.pool.ntp.org", "server-dns-names": "", "mode": "unicast"}
+        return dict(self._NTP_CLIENT)
 
     async def set_ntp_servers(self, primary: str, secondary: str = ""):
         pass
@@ -476,7 +590,7 @@ class MockRouter(RouterBase):
         ]
 
     async def add_user(self, name: str, password: str, group: str = "read") -> str:
-        return f"*{random.randint(10, 99)}"
+        return self._new_id()
 
     async def remove_user(self, id_: str):
         pass
@@ -484,30 +598,37 @@ class MockRouter(RouterBase):
     # ─── Tools ────────────────────────────────────────────────────────────────
 
     async def ping(self, address: str, count: int = 4) -> list[dict]:
-        results = []
-        for i in range(count):
-            await asyncio.sleep(0.1)
-            loss = random.random() < 0.1
-            results.append({
+        # One sleep for the whole run instead of one scheduler turn per reply
+        await asyncio.sleep(0.1 * count)
+        lost = random.choices(_LOSS, _LOSS_WEIGHTS, k=count)
+        times = random.choices(_PING_TIMES, k=count)
+        return [
+            {
                 "host": address,
-                "sent": str(i + 1),
+                "sent": str(i),
                 "received": "0" if loss else "1",
-                "time": "0" if loss else str(random.randint(1, 50)),
-                "ttl": "64" if not loss else "",
-            })
-        return results
+                "time": "0" if loss else str(rtt),
+                "ttl": "" if loss else "64",
+            }
+            for i, (loss, rtt) in enumerate(zip(lost, times), start=1)
+        ]
 
     async def traceroute(self, address: str) -> list[dict]:
-        hops = []
-        for i in range(1, random.randint(5, 12)):
-            await asyncio.sleep(0.05)
-            hops.append({
-                "address": _rand_ip(f"10.{i}"),
-                "time": str(random.randint(1, 100)),
+        n = random.randint(5, 12) - 1
+        await asyncio.sleep(0.05 * n)
+        octets = random.choices(_HOST_OCTETS, k=n)
+        times = random.choices(_HOP_TIMES, k=n)
+        timed_out = random.choices(_LOSS, _LOSS_WEIGHTS, k=n)
+        hops = [
+            {
+                "address": f"10.{i}.{octet}",
+                "time": str(rtt),
                 "count": str(i),
-                "status": "timed-out" if random.random() < 0.1 else "",
-            })
-        hops.append({"address": address, "time": str(random.randint(20, 200)), "count": str(len(hops) + 1), "status": ""})
+                "status": "timed-out" if lost else "",
+            }
+            for i, (octet, rtt, lost) in enumerate(zip(octets, times, timed_out), start=1)
+        ]
+        hops.append({"address": address, "time": str(random.randint(20, 200)), "count": str(n + 1), "status": ""})
         return hops
 
     async def bandwidth_test(self, address: str, duration: int = 5) -> dict:
@@ -3,17 +3,22 @@ Background monitor – polls all connected routers every N seconds,
 detects threshold breaches, and pushes Telegram alerts.
 
 CHANGES vs original:
-  - _poll_all() now uses asyncio.gather() — all routers polled concurrently
-  - _poll_router() gathers its 3 independent API calls concurrently
+  - _poll_all() feeds a queue drained by a fixed pool of POLL_WORKERS
+    long-lived tasks — routers polled concurrently without per-cycle tasks
+  - _poll_router() reads resource/interfaces/leases via one pipelined
+    get_monitor_snapshot() batch instead of 3 separate calls
   - AlertState is now keyed by (user_id, alias) not just user_id — fixes
     bug where 2 routers shared one alert state per user
-  - Monitor no longer accesses rm._entries directly — uses rm.iter_all_entries()
+  - Monitor no longer accesses rm._entries directly — polls the routers from
+    rm.iter_connected_entries()
   - last_status cleaned up via on_router_removed() hook
   - asyncio.get_event_loop() replaced with asyncio.get_running_loop()
 """
 
 import asyncio
 import logging
+import time
+from collections import defaultdict, deque
 from datetime import datetime
 from typing import Optional
 
@@ -33,15 +38,51 @@ CPU_THRESHOLD = 90
 MEMORY_THRESHOLD = 90
 INTERFACE_DOWN_ALERT = True
 POLL_INTERVAL = 30  # seconds
+POLL_WORKERS = 8    # long-lived poller tasks shared by all routers
+MAX_POLL_BACKOFF = 16  # failing routers are polled at most every 16 cycles
+ALERT_MESSAGE_LIMIT = 4000  # Telegram caps messages at 4096 chars
+
+# Flap detection: FLAP_COUNT up/down changes within FLAP_WINDOW seconds marks
+# an interface as flapping; it is cleared after FLAP_QUIET seconds without one
+FLAP_COUNT = 4
+FLAP_WINDOW = 600
+FLAP_QUIET = 900
+
+# Alert templates — filled from AlertState.ctx via str.format_map()
+_CPU_ALERT = "🔥 *{alias}* ({host})\n⚠️ HIGH CPU: {cpu}%"
+_MEM_ALERT = "💾 *{alias}* ({host})\n⚠️ HIGH MEMORY: {mem}%"
+_IFACE_DOWN = "📵 *{alias}* ({host})\n🔴 Interface `{name}` is DOWN"
+_IFACE_UP = "✅ *{alias}* ({host})\n🟢 Interface `{name}` is UP"
+_IFACE_FLAPPING = "⚡ *{alias}* ({host})\n🟠 Interface `{name}` is FLAPPING — alerts muted"
+_IFACE_STABLE = "✅ *{alias}* ({host})\n🔵 Interface `{name}` stopped flapping, now {status}"
+_NEW_DEVICE = "🔍 *{alias}*\nNew device on network:\n🖥 `{host_name}` — `{ip}` — `{mac}`"
 
 
 class AlertState:
     """Per-router alert state — prevents duplicate alerts."""
+    __slots__ = (
+        "cpu_alerted", "mem_alerted", "interface_down", "last_seen_macs",
+        "iface_flips", "iface_flapping", "fail_streak", "skip_polls", "ctx",
+    )
+
     def __init__(self):
         self.cpu_alerted: bool = False
         self.mem_alerted: bool = False
-        self.interface_down: set[str] = set()
+        self.interface_down: set[str] = set()   # names of interfaces alerted down
         self.last_seen_macs: set[str] = set()
+        # Flap detection: recent change times per interface, and muted names
+        self.iface_flips: defaultdict[str, deque[float]] = defaultdict(
+            lambda: deque(maxlen=FLAP_COUNT)
+        )
+        self.iface_flapping: set[str] = set()
+        # Poll backoff: consecutive failed polls, and poll cycles left to skip
+        self.fail_streak: int = 0
+        self.skip_polls: int = 0
+        # Reused substitution dict for the alert templates
+        self.ctx: dict = {
+            "alias": "", "host": "", "cpu": 0, "mem": 0,
+            "name": "", "status": "", "host_name": "", "ip": "", "mac": "",
+        }
 
 
 class Monitor:
@@ -60,15 +101,27 @@ class Monitor:
         # DHCP Guard (optional; if None, guard features are inactive)
         self.guard_store = guard_store
         self.guard_detector = guard_detector
-        # Key: (user_id, alias) — one AlertState per router, not per user
-        self._alert_states: dict[tuple[int, str], AlertState] = {}
+        # user_id -> alias -> AlertState — one state per router, not per user
+        self._alert_states: dict[int, dict[str, AlertState]] = {}
         self._running = False
         self._task: Optional[asyncio.Task] = None
+        # Poll queue drained by a fixed worker pool created once in start()
+        self._work_q: asyncio.Queue = asyncio.Queue()
+        self._workers: list[asyncio.Task] = []
+        # Strong refs to fire-and-forget tasks — the loop only keeps weak ones
+        self._bg_tasks: set[asyncio.Task] = set()
+        # Alerts raised during the current poll cycle: user_id -> texts
+        self._pending_alerts: dict[int, list[str]] = {}
+        # ISO timestamp of the current poll cycle, shared by every router
+        self._cycle_ts: str = ""
         # Cached status: user_id -> {alias -> stats dict}
         self.last_status: dict[int, dict] = {}
 
     async def start(self) -> None:
         self._running = True
+        self._workers = [
+            asyncio.create_task(self._worker()) for _ in range(POLL_WORKERS)
+        ]
         self._task = asyncio.create_task(self._loop())
         log.info("Monitor started")
 
@@ -80,10 +133,27 @@ class Monitor:
                 await self._task
             except asyncio.CancelledError:
                 pass
+        for w in self._workers:
+            w.cancel()
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+            self._workers = []
+        if self._bg_tasks:
+            await asyncio.gather(*self._bg_tasks, return_exceptions=True)
+
+    def _spawn(self, coro) -> None:
+        """Run coro in the background, keeping it referenced until done."""
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
 
     def on_router_removed(self, user_id: int, alias: str) -> None:
         """Call this when a router is removed to clean up stale cache."""
-        self._alert_states.pop((user_id, alias), None)
+        states = self._alert_states.get(user_id)
+        if states is not None:
+            states.pop(alias, None)
+            if not states:
+                del self._alert_states[user_id]
         if user_id in self.last_status:
             self.last_status[user_id].pop(alias, None)
             if not self.last_status[user_id]:
@@ -93,7 +163,7 @@ class Monitor:
             self.guard_detector.reset(user_id, alias)
         if self.guard_store:
             # Fire-and-forget; removal from store is async
-            asyncio.create_task(self.guard_store.remove(user_id, alias))
+            self._spawn(self.guard_store.remove(user_id, alias))
 
     async def _loop(self) -> None:
         while self._running:
@@ -103,35 +173,58 @@ class Monitor:
                 log.warning(f"Monitor poll error: {e}")
             await asyncio.sleep(POLL_INTERVAL)
 
+    async def _worker(self) -> None:
+        """Drain the poll queue forever — one of POLL_WORKERS pollers."""
+        while True:
+            item = await self._work_q.get()
+            try:
+                await self._poll_router(*item)
+            except Exception as e:
+                log.debug(f"Poll error for {item[1]}: {e}")
+            finally:
+                self._work_q.task_done()
+
     async def _poll_all(self) -> None:
-        """Poll all connected routers concurrently."""
-        tasks = [
-            self._poll_router(uid, alias, entry.router, entry.host)
-            for uid, alias, entry in self.rm.iter_all_entries()
-            if entry.router and entry.router.connected
-        ]
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+        """Queue every connected router and wait for the workers to finish."""
+        self._cycle_ts = datetime.now().isoformat(timespec="seconds")
+        for uid, alias, entry in self.rm.iter_connected_entries():
+            if not entry.router.connected:
+                continue
+            states = self._alert_states.get(uid)
+            state = states.get(alias) if states else None
+            if state and state.skip_polls:
+                state.skip_polls -= 1
+                continue
+            self._work_q.put_nowait((uid, alias, entry.router, entry.host))
+        await self._work_q.join()
+        await self._flush_alerts()
 
     async def _poll_router(self, user_id: int, alias: str, router, host: str) -> None:
-        # Keyed by (user_id, alias) — one state per router, not per user
-        state = self._alert_states.setdefault((user_id, alias), AlertState())
+        # One state per router, not per user; only built on first poll
+        states = self._alert_states.get(user_id)
+        if states is None:
+            states = self._alert_states[user_id] = {}
+        state = states.get(alias)
+        if state is None:
+            state = states[alias] = AlertState()
+        ctx = state.ctx
+        ctx["alias"] = alias
+        ctx["host"] = host
 
         try:
-            # Gather the 3 independent API calls concurrently
-            res, ifaces, leases = await asyncio.gather(
-                router.get_system_resource(),
-                router.get_interfaces() if INTERFACE_DOWN_ALERT else _empty(),
-                router.get_dhcp_leases(),
-                return_exceptions=True,
-            )
+            # One pipelined round trip for resource, interfaces and leases
+            snap = await router.get_monitor_snapshot()
         except Exception as e:
-            log.debug(f"Poll gather error for {alias}: {e}")
+            log.debug(f"Poll snapshot error for {alias}: {e}")
+            _poll_failed(state, alias)
             return
+        res, ifaces, leases = snap["resource"], snap["interfaces"], snap["leases"]
 
         # ── Resource metrics ────────────────────────────────────────────────
-        if isinstance(res, Exception) or not res:
+        if not res:
+            _poll_failed(state, alias)
             return
+        state.fail_streak = 0
 
         cpu = int(res.get("cpu-load", 0))
         total_mem = int(res.get("total-memory", 1))
@@ -142,60 +235,61 @@ class Monitor:
             "cpu": cpu,
             "mem_pct": mem_pct,
             "uptime": res.get("uptime", "?"),
-            "polled_at": datetime.now().isoformat(),
+            "polled_at": self._cycle_ts,
         }
 
         # CPU alert (with 10% hysteresis to prevent flapping)
         if cpu >= CPU_THRESHOLD and not state.cpu_alerted:
             state.cpu_alerted = True
-            await self._send_alert(user_id, f"🔥 *{alias}* ({host})\n⚠️ HIGH CPU: {cpu}%")
+            ctx["cpu"] = cpu
+            await self._send_alert(user_id, _CPU_ALERT.format_map(ctx))
         elif cpu < CPU_THRESHOLD - 10:
             state.cpu_alerted = False
 
         # Memory alert
         if mem_pct >= MEMORY_THRESHOLD and not state.mem_alerted:
             state.mem_alerted = True
-            await self._send_alert(user_id, f"💾 *{alias}* ({host})\n⚠️ HIGH MEMORY: {mem_pct}%")
+            ctx["mem"] = mem_pct
+            await self._send_alert(user_id, _MEM_ALERT.format_map(ctx))
         elif mem_pct < MEMORY_THRESHOLD - 10:
             state.mem_alerted = False
 
         # ── Interface down alerts ───────────────────────────────────────────
-        if INTERFACE_DOWN_ALERT and isinstance(ifaces, list):
+        if INTERFACE_DOWN_ALERT and ifaces is not None:
+            now = time.monotonic()
             for iface in ifaces:
                 name = iface.get("name", "")
-                running = iface.get("running", "true") == "true"
-                disabled = iface.get("disabled", "false") == "true"
-                key = f"{alias}:{name}"
-                if not running and not disabled:
-                    if key not in state.interface_down:
-                        state.interface_down.add(key)
-                        await self._send_alert(
-                            user_id,
-                            f"📵 *{alias}* ({host})\n🔴 Interface `{name}` is DOWN"
-                        )
+                if not iface.get("running", True) and not iface.get("disabled", False):
+                    if name not in state.interface_down:
+                        state.interface_down.add(name)
+                        await self._iface_changed(user_id, state, name, now, _IFACE_DOWN)
                 else:
-                    if key in state.interface_down:
-                        state.interface_down.discard(key)
-                        await self._send_alert(
-                            user_id,
-                            f"✅ *{alias}* ({host})\n🟢 Interface `{name}` is UP"
-                        )
+                    if name in state.interface_down:
+                        state.interface_down.discard(name)
+                        await self._iface_changed(user_id, state, name, now, _IFACE_UP)
+
+            # Unmute interfaces that have been stable for FLAP_QUIET
+            for name in [
+                n for n in state.iface_flapping
+                if now - state.iface_flips[n][-1] >= FLAP_QUIET
+            ]:
+                state.iface_flapping.discard(name)
+                ctx["name"] = name
+                ctx["status"] = "DOWN" if name in state.interface_down else "UP"
+                await self._send_alert(user_id, _IFACE_STABLE.format_map(ctx))
 
         # ── New DHCP client detection ───────────────────────────────────────
-        if isinstance(leases, list):
+        if leases is not None:
             try:
-                macs = {l.get("mac-address", "") for l in leases}
-                new_macs = macs - state.last_seen_macs
+                lease_by_mac = {l.get("mac-address", ""): l for l in leases}
+                new_macs = lease_by_mac.keys() - state.last_seen_macs
                 for mac in new_macs:
-                    lease = next((l for l in leases if l.get("mac-address") == mac), {})
-                    ip = lease.get("address", "?")
-                    host_name = lease.get("host-name", "unknown")
-                    await self._send_alert(
-                        user_id,
-                        f"🔍 *{alias}*\nNew device on network:\n"
-                        f"🖥 `{host_name}` — `{ip}` — `{mac}`"
-                    )
-                state.last_seen_macs = macs
+                    lease = lease_by_mac[mac]
+                    ctx["ip"] = lease.get("address", "?")
+                    ctx["host_name"] = lease.get("host-name", "unknown")
+                    ctx["mac"] = mac
+                    await self._send_alert(user_id, _NEW_DEVICE.format_map(ctx))
+                state.last_seen_macs = set(lease_by_mac)
             except Exception:
                 pass
 
@@ -203,7 +297,7 @@ class Monitor:
         if (
             self.guard_store is not None
             and self.guard_detector is not None
-            and isinstance(leases, list)
+            and leases is not None
         ):
             try:
                 settings = self.guard_store.get(user_id, alias)
@@ -215,6 +309,20 @@ class Monitor:
             except Exception as e:
                 log.warning(f"DHCP Guard detector error for {alias}: {e}")
 
+    async def _iface_changed(
+        self, user_id: int, state: AlertState, name: str, now: float, template: str
+    ) -> None:
+        """Alert an up/down change unless the interface is (or just became) flapping."""
+        flips = state.iface_flips[name]
+        flips.append(now)
+        if name in state.iface_flapping:
+            return
+        state.ctx["name"] = name
+        if len(flips) == FLAP_COUNT and now - flips[0] <= FLAP_WINDOW:
+            state.iface_flapping.add(name)
+            template = _IFACE_FLAPPING
+        await self._send_alert(user_id, template.format_map(state.ctx))
+
     async def _handle_dhcp_attack(
         self, user_id: int, alias: str, router, host: str,
         settings, report
@@ -234,12 +342,38 @@ class Monitor:
                 log.warning(f"Auto-purge failed for {alias}: {e}")
 
     async def _send_alert(self, user_id: int, text: str) -> None:
-        try:
-            await self.bot.send_message(user_id, text, parse_mode="Markdown")
-        except Exception as e:
-            log.warning(f"Failed to send alert to {user_id}: {e}")
+        """Queue an alert; _flush_alerts() sends it at the end of the cycle."""
+        self._pending_alerts.setdefault(user_id, []).append(text)
+
+    async def _flush_alerts(self) -> None:
+        """Send each user's alerts from this cycle as few messages as possible."""
+        pending, self._pending_alerts = self._pending_alerts, {}
+        for user_id, texts in pending.items():
+            for chunk in _pack_alerts(texts):
+                try:
+                    await self.bot.send_message(user_id, chunk, parse_mode="Markdown")
+                except Exception as e:
+                    log.warning(f"Failed to send alert to {user_id}: {e}")
+
+
+def _pack_alerts(texts: list[str]) -> list[str]:
+    """Join alerts with blank lines into chunks of at most ALERT_MESSAGE_LIMIT chars."""
+    chunks: list[str] = []
+    buf: list[str] = []
+    size = 0
+    for text in texts:
+        if buf and size + 2 + len(text) > ALERT_MESSAGE_LIMIT:
+            chunks.append("\n\n".join(buf))
+            buf, size = [], 0
+        size += len(text) + (2 if buf else 0)
+        buf.append(text)
+    if buf:
+        chunks.append("\n\n".join(buf))
+    return chunks
 
 
-async def _empty() -> list:
-    """Placeholder coroutine for disabled gather slots."""
-    return []
+def _poll_failed(state: AlertState, alias: str) -> None:
+    """Back off exponentially: skip 2^streak - 1 cycles, capped at MAX_POLL_BACKOFF."""
+    state.fail_streak += 1
+    state.skip_polls = min(2 ** state.fail_streak, MAX_POLL_BACKOFF) - 1
+    log.debug(f"Poll of {alias} failed {state.fail_streak}x, skipping {state.skip_polls} cycle(s)")
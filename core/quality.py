@@ -21,7 +21,8 @@ async def check_api_latency(router, samples: int = 3) -> dict:
     for _ in range(samples):
         t0 = time.monotonic()
         try:
-            await asyncio.wait_for(router.get_system_identity(), timeout=5.0)
+            async with asyncio.timeout(5.0):
+                await router.get_system_identity()
             times.append((time.monotonic() - t0) * 1000)
         except Exception:
             errors += 1
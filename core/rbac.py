@@ -11,21 +11,31 @@ CHANGES vs original:
   - _load() / _save() now use asyncio.to_thread() to avoid blocking the event loop
   - Added async_save() / async_load() public async variants
   - Synchronous _load() is kept only for __init__ (before the event loop starts)
+  - Mutations append one line to data/rbac.wal instead of rewriting rbac.json;
+    the log is folded back into rbac.json once it grows past WAL_COMPACT_BYTES
+  - rbac.json is replaced atomically (temp file + fsync + os.replace)
 """
 
 import asyncio
+import inspect
 import json
 import logging
+import os
+import tempfile
 from enum import IntEnum
 from pathlib import Path
-from typing import Optional
+from typing import Optional, get_args
 from functools import wraps
 
 from aiogram.types import Message, CallbackQuery
 
+from .api_protocol import dumpb
+
 log = logging.getLogger("RBAC")
 
 RBAC_FILE = Path("data/rbac.json")
+RBAC_WAL = Path("data/rbac.wal")
+WAL_COMPACT_BYTES = 4096
 
 
 class Role(IntEnum):
@@ -131,6 +141,20 @@ PERMISSIONS: dict[str, Role] = {
     "dns.manage": Role.ADMIN,
 }
 
+# Integer handles for PERMISSIONS, in map order: "firewall.nat.view" is
+# Permission.firewall_nat_view, and REQUIRED_ROLE[perm] is its minimum role
+Permission = IntEnum(
+    "Permission", {p.replace(".", "_"): i for i, p in enumerate(PERMISSIONS)}
+)
+REQUIRED_ROLE: tuple[Role, ...] = tuple(PERMISSIONS.values())
+
+# One bit per permission; each role's mask ORs every permission it meets
+_PERM_BITS: dict[str, int] = {p: 1 << i for i, p in enumerate(PERMISSIONS)}
+ROLE_MASKS: dict[Role, int] = {
+    role: sum(bit for p, bit in _PERM_BITS.items() if role >= PERMISSIONS[p])
+    for role in Role
+}
+
 
 class RBACManager:
 
@@ -138,6 +162,8 @@ class RBACManager:
         self._roles: dict[int, Role] = {}
         self._owner_id: Optional[int] = None
         self._write_lock = asyncio.Lock()
+        # get_all_users() result, rebuilt lazily after any role change
+        self._users_view: Optional[list[dict]] = None
         # Synchronous load only during __init__ (before event loop is running)
         self._load_sync()
 
@@ -145,15 +171,48 @@ class RBACManager:
 
     def _load_sync(self) -> None:
         """Synchronous load — only safe to call before the event loop starts."""
-        if not RBAC_FILE.exists():
+        # No snapshot until the first compaction: the WAL alone holds the ops
+        if RBAC_FILE.exists():
+            try:
+                data = json.loads(RBAC_FILE.read_bytes())
+                self._owner_id = data.get("owner_id")
+                for uid_str, role_str in data.get("roles", {}).items():
+                    self._roles[int(uid_str)] = Role.from_str(role_str)
+            except Exception as e:
+                log.warning(f"Failed to load RBAC: {e}")
+        self._replay_wal_sync()
+
+    def _replay_wal_sync(self) -> None:
+        """Apply ops logged since the last compaction on top of the snapshot."""
+        if not RBAC_WAL.exists():
             return
         try:
-            data = json.loads(RBAC_FILE.read_text())
-            self._owner_id = data.get("owner_id")
-            for uid_str, role_str in data.get("roles", {}).items():
-                self._roles[int(uid_str)] = Role.from_str(role_str)
+            text = RBAC_WAL.read_text()
+            if text and not text.endswith("\n"):
+                # Terminate a torn line so the next append starts cleanly
+                with RBAC_WAL.open("a", encoding="utf-8") as f:
+                    f.write("\n")
         except Exception as e:
-            log.warning(f"Failed to load RBAC: {e}")
+            log.warning(f"Failed to read RBAC WAL: {e}")
+            return
+        for line in text.splitlines():
+            try:
+                self._apply(json.loads(line))
+            except Exception:
+                # A torn final line from a crash mid-append — skip it
+                log.warning(f"Skipping bad RBAC WAL line: {line!r}")
+
+    def _apply(self, op: dict) -> None:
+        self._users_view = None
+        uid = op["uid"]
+        match op["op"]:
+            case "set":
+                self._roles[uid] = Role.from_str(op["role"])
+            case "remove":
+                self._roles.pop(uid, None)
+            case "owner":
+                self._owner_id = uid
+                self._roles[uid] = Role.OWNER
 
     def _build_payload(self) -> dict:
         return {
@@ -161,21 +220,14 @@ class RBACManager:
             "roles": {str(uid): role.to_str() for uid, role in self._roles.items()},
         }
 
-    def _write_sync(self) -> None:
-        """Actual file write — called via asyncio.to_thread to stay off the event loop."""
-        RBAC_FILE.parent.mkdir(parents=True, exist_ok=True)
-        RBAC_FILE.write_text(json.dumps(self._build_payload(), indent=2))
-
-    async def _save(self) -> None:
-        """Non-blocking async save — offloads disk write to a thread pool."""
+    async def _append_wal(self, op: dict) -> None:
+        """Log one mutation (already applied in memory); compact when the log is big."""
+        line = json.dumps(op) + "\n"
         async with self._write_lock:
-            payload = self._build_payload()
-            await asyncio.to_thread(
-                lambda: (
-                    RBAC_FILE.parent.mkdir(parents=True, exist_ok=True),
-                    RBAC_FILE.write_text(json.dumps(payload, indent=2)),
-                )
-            )
+            size = await asyncio.to_thread(_append_sync, line)
+            if size > WAL_COMPACT_BYTES:
+                payload = self._build_payload()
+                await asyncio.to_thread(_compact_sync, payload)
 
     # ─── Bootstrap ────────────────────────────────────────────────────────────
 
@@ -185,7 +237,8 @@ class RBACManager:
             return False
         self._owner_id = user_id
         self._roles[user_id] = Role.OWNER
-        await self._save()
+        self._users_view = None
+        await self._append_wal({"op": "owner", "uid": user_id})
         return True
 
     def is_bootstrapped(self) -> bool:
@@ -195,39 +248,57 @@ class RBACManager:
 
     async def set_role(self, user_id: int, role: Role) -> None:
         self._roles[user_id] = role
-        await self._save()
+        self._users_view = None
+        await self._append_wal({"op": "set", "uid": user_id, "role": role.to_str()})
 
     async def remove_user(self, user_id: int) -> None:
         self._roles.pop(user_id, None)
-        await self._save()
+        self._users_view = None
+        await self._append_wal({"op": "remove", "uid": user_id})
 
     def get_role(self, user_id: int) -> Optional[Role]:
         return self._roles.get(user_id)
 
     def get_all_users(self) -> list[dict]:
-        return [
-            {"user_id": uid, "role": role.to_str(), "is_owner": uid == self._owner_id}
-            for uid, role in self._roles.items()
-        ]
+        """Cached between role changes — treat the returned dicts as read-only."""
+        if self._users_view is None:
+            self._users_view = [
+                {"user_id": uid, "role": role.to_str(), "is_owner": uid == self._owner_id}
+                for uid, role in self._roles.items()
+            ]
+        return list(self._users_view)
 
     def is_known(self, user_id: int) -> bool:
         return user_id in self._roles
 
     # ─── Permission Checking ──────────────────────────────────────────────────
 
-    def can(self, user_id: int, permission: str) -> bool:
+    def can(self, user_id: int, permission: "str | Permission") -> bool:
         role = self._roles.get(user_id)
         if role is None:
             return False
-        required = PERMISSIONS.get(permission, Role.OWNER)
-        return role >= required
+        if isinstance(permission, Permission):
+            return role >= REQUIRED_ROLE[permission]
+        bit = _PERM_BITS.get(permission)
+        if bit is None:
+            # Unknown permissions are owner-only
+            return role >= Role.OWNER
+        return bool(ROLE_MASKS[role] & bit)
+
+    def can_role(self, user_id: int, required: Role) -> bool:
+        """Like can(), for callers that resolved the required role up front."""
+        role = self._roles.get(user_id)
+        return role is not None and role >= required
 
-    def require(self, user_id: int, permission: str) -> bool:
+    def require(self, user_id: int, permission: "str | Permission") -> bool:
         """Raises PermissionError with a descriptive message if access is denied."""
-        if not self.can(user_id, permission):
+        return self.require_role(user_id, required_role(permission))
+
+    def require_role(self, user_id: int, required: Role) -> bool:
+        """require() with the required role already resolved."""
+        if not self.can_role(user_id, required):
             role = self._roles.get(user_id)
             role_str = role.to_str() if role else "unknown"
-            required = PERMISSIONS.get(permission, Role.OWNER)
             raise PermissionError(
                 f"🚫 Access denied.\n"
                 f"Your role: `{role_str}` | Required: `{required.to_str()}`"
@@ -235,34 +306,85 @@ class RBACManager:
         return True
 
 
+def _append_sync(line: str) -> int:
+    """Append + fsync one WAL line. Returns the WAL size afterwards."""
+    RBAC_WAL.parent.mkdir(parents=True, exist_ok=True)
+    with RBAC_WAL.open("a", encoding="utf-8") as f:
+        f.write(line)
+        f.flush()
+        os.fsync(f.fileno())
+        return f.tell()
+
+
+def _write_sync(payload: dict) -> None:
+    """Atomically replace rbac.json: temp file in the same dir, fsync, rename."""
+    RBAC_FILE.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=RBAC_FILE.parent, prefix=".rbac-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(dumpb(payload))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, RBAC_FILE)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _compact_sync(payload: dict) -> None:
+    """Write the full snapshot, then drop the WAL it supersedes."""
+    _write_sync(payload)
+    # Replaying the old WAL over the new snapshot is harmless (ops are
+    # last-write-wins), so a crash before the truncate loses nothing.
+    RBAC_WAL.write_text("")
+
+
 # ─── Decorator for handlers ───────────────────────────────────────────────────
 
-def require_permission(permission: str):
+_EVENT_TYPES = (Message, CallbackQuery)
+
+
+def _event_param(func) -> tuple[int, str]:
+    """
+    (position, name) of the handler's Message/CallbackQuery parameter,
+    found from its annotations. Defaults to the first parameter, which is
+    where aiogram passes the event.
+    """
+    params = list(inspect.signature(func).parameters.values())
+    for i, p in enumerate(params):
+        ann = p.annotation
+        if ann in _EVENT_TYPES or any(a in _EVENT_TYPES for a in get_args(ann)):
+            return i, p.name
+    return 0, params[0].name if params else ""
+
+
+def required_role(permission: "str | Permission") -> Role:
+    """Minimum role for a permission; unknown names are owner-only."""
+    if isinstance(permission, Permission):
+        return REQUIRED_ROLE[permission]
+    return PERMISSIONS.get(permission, Role.OWNER)
+
+
+def require_permission(permission: "str | Permission"):
     """
     Decorator for aiogram handlers.
     Usage: @require_permission("firewall.manage")
+       or: @require_permission(Permission.firewall_manage)
     """
+    # Resolved once here rather than on every handler call
+    required = required_role(permission)
+
     def decorator(func):
+        event_pos, event_name = _event_param(func)
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            rbac: Optional[RBACManager] = None
             user_id: Optional[int] = None
-            msg_or_cb = None
-
-            for arg in args:
-                if isinstance(arg, (Message, CallbackQuery)):
-                    msg_or_cb = arg
-                    user_id = arg.from_user.id
-                    break
-
-            if msg_or_cb is None:
-                for v in kwargs.values():
-                    if isinstance(v, (Message, CallbackQuery)):
-                        msg_or_cb = v
-                        user_id = v.from_user.id
-                        break
+            msg_or_cb = args[event_pos] if event_pos < len(args) else kwargs.get(event_name)
+            if isinstance(msg_or_cb, _EVENT_TYPES):
+                user_id = msg_or_cb.from_user.id
 
-            rbac = kwargs.get("rbac")
+            rbac: Optional[RBACManager] = kwargs.get("rbac")
 
             if rbac and user_id:
                 if not rbac.is_known(user_id):
@@ -272,7 +394,7 @@ def require_permission(permission: str):
                         await msg_or_cb.answer("🚫 Not authorized.", show_alert=True)
                     return
                 try:
-                    rbac.require(user_id, permission)
+                    rbac.require_role(user_id, required)
                 except PermissionError as e:
                     if isinstance(msg_or_cb, Message):
                         await msg_or_cb.answer(str(e), parse_mode="Markdown")
@@ -2,8 +2,29 @@
 Abstract RouterBase – defines the full interface every router implementation must expose.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import AsyncIterator
+from typing import AsyncIterator, Iterable
+
+from .router_client import APIError
+
+# stream_logs() batching: yield after this many entries or this many seconds
+LOG_BATCH_MAX = 10
+LOG_BATCH_WINDOW = 5.0
+# Rows batch_by_time() holds for a slow consumer before it stops reading
+LOG_BUFFER_MAX = 100
+
+# snapshot() section -> (getter, factory for the value used if the router refuses it)
+SNAPSHOT_SECTIONS = {
+    "resource": ("get_system_resource", dict),
+    "identity": ("get_system_identity", lambda: "unknown"),
+    "health": ("get_system_health", dict),
+    "routerboard": ("get_system_routerboard", dict),
+    "interfaces": ("get_interfaces", list),
+    "addresses": ("get_ip_addresses", list),
+    "routes": ("get_routes", list),
+    "arp": ("get_arp", list),
+}
 
 
 class RouterBase(ABC):
@@ -48,11 +69,65 @@ class RouterBase(ABC):
     async def reboot(self):
         ...
 
+    @abstractmethod
+    async def get_monitor_snapshot(self) -> dict:
+        """
+        {"resource": dict, "interfaces": list, "leases": list} in one round trip.
+        A section that could not be read is None.
+        """
+        ...
+
+    @staticmethod
+    async def _each(op, ids: list[str]) -> int:
+        """
+        Apply a single-id operation to each id; returns how many succeeded.
+        An id the router refuses (APIError) is skipped. Any other error (e.g.
+        the connection dropped) stops the loop: it is raised if nothing was
+        applied yet, otherwise the partial count is returned.
+        """
+        done = 0
+        for id_ in ids:
+            try:
+                await op(id_)
+                done += 1
+            except APIError:
+                pass
+            except Exception:
+                if not done:
+                    raise
+                break
+        return done
+
+    async def snapshot(self, sections: Iterable[str] | None = None) -> dict:
+        """
+        Several read-only views fetched concurrently, keyed by SNAPSHOT_SECTIONS
+        name (all of them by default). Requests are multiplexed by tag on one
+        connection, so this costs about one round trip, not one per section.
+        A section the router refuses (APIError) gets its empty value; any
+        other error is raised.
+        """
+        names = list(SNAPSHOT_SECTIONS if sections is None else sections)
+        results = await asyncio.gather(
+            *(getattr(self, SNAPSHOT_SECTIONS[name][0])() for name in names),
+            return_exceptions=True,
+        )
+        snap = {}
+        for name, result in zip(names, results):
+            if isinstance(result, APIError):
+                result = SNAPSHOT_SECTIONS[name][1]()
+            elif isinstance(result, BaseException):
+                raise result
+            snap[name] = result
+        return snap
+
     # ─── Interfaces ───────────────────────────────────────────────────────────
 
     @abstractmethod
     async def get_interfaces(self) -> list[dict]:
-        """All interfaces with name, type, running, disabled, rx-byte, tx-byte, etc."""
+        """
+        All interfaces with name, type, running, disabled, rx-byte, tx-byte, etc.
+        running/disabled are real bools; everything else is RouterOS strings.
+        """
         ...
 
     @abstractmethod
@@ -105,6 +180,19 @@ class RouterBase(ABC):
     async def disable_firewall_rule(self, id_: str):
         ...
 
+    # Bulk variants return how many items were applied (see _each for which
+    # errors they raise). These defaults make one call per id; RouterROS6
+    # sends a single numbers=a,b,c command.
+
+    async def remove_firewall_rules(self, ids: list[str]) -> int:
+        return await self._each(self.remove_firewall_rule, ids)
+
+    async def enable_firewall_rules(self, ids: list[str]) -> int:
+        return await self._each(self.enable_firewall_rule, ids)
+
+    async def disable_firewall_rules(self, ids: list[str]) -> int:
+        return await self._each(self.disable_firewall_rule, ids)
+
     @abstractmethod
     async def move_firewall_rule(self, id_: str, destination: int):
         ...
@@ -133,6 +221,9 @@ class RouterBase(ABC):
     async def remove_address_list_entry(self, id_: str):
         ...
 
+    async def remove_address_list_entries(self, ids: list[str]) -> int:
+        return await self._each(self.remove_address_list_entry, ids)
+
     @abstractmethod
     async def get_connection_tracking(self) -> list[dict]:
         ...
@@ -147,6 +238,10 @@ class RouterBase(ABC):
     async def get_dhcp_leases(self) -> list[dict]:
         ...
 
+    async def get_dhcp_lease(self, id_: str) -> dict | None:
+        """One lease by .id, or None."""
+        return next((l for l in await self.get_dhcp_leases() if l.get(".id") == id_), None)
+
     @abstractmethod
     async def add_dhcp_static_lease(self, mac: str, ip: str, comment: str = "") -> str:
         ...
@@ -155,6 +250,9 @@ class RouterBase(ABC):
     async def remove_dhcp_lease(self, id_: str):
         ...
 
+    async def remove_dhcp_leases(self, ids: list[str]) -> int:
+        return await self._each(self.remove_dhcp_lease, ids)
+
     @abstractmethod
     async def make_dhcp_lease_static(self, id_: str):
         ...
@@ -265,7 +363,8 @@ class RouterBase(ABC):
         ...
 
     @abstractmethod
-    async def stream_logs(self, topics: str = "") -> AsyncIterator[dict]:
+    async def stream_logs(self, topics: str = "") -> AsyncIterator[list[dict]]:
+        """Live log entries, in batches of up to LOG_BATCH_MAX per LOG_BATCH_WINDOW."""
         ...
 
     # ─── Routing ──────────────────────────────────────────────────────────────
@@ -415,3 +514,84 @@ class RouterBase(ABC):
 
     async def get_wireguard_peers(self) -> list[dict]:
         return []
+
+
+async def batch_by_time(
+    source: AsyncIterator[dict],
+    max_batch: int = LOG_BATCH_MAX,
+    window: float = LOG_BATCH_WINDOW,
+    max_buffered: int = LOG_BUFFER_MAX,
+) -> AsyncIterator[list[dict]]:
+    """
+    Regroup a stream into lists: a batch is yielded once it holds max_batch
+    items or `window` seconds after its first item, whichever comes first —
+    so a quiet stream never holds a partial batch back. At most max_buffered
+    items wait between reads; beyond that `source` isn't read until the
+    consumer takes a batch.
+    """
+    q: asyncio.Queue = asyncio.Queue()
+    # Counts queued items; the queue itself stays unbounded so the end
+    # marker always goes in without blocking
+    room = asyncio.Semaphore(max(max_buffered, max_batch))
+    end = object()
+    error: list[BaseException] = []
+
+    async def pump() -> None:
+        try:
+            async for item in source:
+                await room.acquire()
+                q.put_nowait(item)
+        except Exception as e:
+            error.append(e)
+        finally:
+            q.put_nowait(end)
+
+    async def get():
+        item = await q.get()
+        if item is not end:
+            room.release()
+        return item
+
+    task = asyncio.create_task(pump())
+    loop = asyncio.get_running_loop()
+    try:
+        item = await get()
+        while item is not end:
+            batch = [item]
+            item = None
+            # Take what's already queued without a task switch per item — a
+            # consumer that fell behind gets full batches straight away
+            while len(batch) < max_batch and not q.empty():
+                item = q.get_nowait()
+                if item is end:
+                    break
+                room.release()
+                batch.append(item)
+                item = None
+            if item is end or len(batch) >= max_batch:
+                yield batch
+                if item is None:
+                    item = await get()
+                continue
+            try:
+                async with asyncio.timeout_at(loop.time() + window):
+                    while len(batch) < max_batch:
+                        item = await get()
+                        if item is end:
+                            break
+                        batch.append(item)
+                        item = None
+            except TimeoutError:
+                item = None
+            yield batch
+            if item is None:
+                item = await get()
+        if error:
+            raise error[0]
+    finally:
+        # Cancelling the pump closes the source (e.g. sends /cancel)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
@@ -13,21 +13,47 @@ Features:
 
 import asyncio
 import logging
+import socket
+import ssl
 import struct
-from typing import AsyncIterator, Optional
+from functools import lru_cache
+from typing import AsyncIterator, Callable, Optional
 
 from .api_protocol import (
+    Reply,
     build_sentence,
-    decode_length,
-    decode_sentence,
+    decode_sentences,
+    encode_word,
     md5_challenge_response,
     parse_response,
 )
 
 log = logging.getLogger("RouterClient")
 
-_RECV_BUF = 65536
-_RECONNECT_DELAYS = [1, 2, 5, 10, 30]
+_RECV_BUF = 65536       # initial receive buffer size
+_RECV_MIN_FREE = 16384  # grow the buffer when less than this is free for a read
+_SO_RCVBUF = 1 << 20    # kernel receive buffer, absorbs /log/print and export bursts
+_LOGIN_WORD = encode_word("/login")
+
+# One client TLS context for every router connection, built on first use —
+# creating one loads the trust store, which is slow, and it is never mutated
+_SHARED_SSL_CTX: Optional[ssl.SSLContext] = None
+
+
+def _get_ssl_ctx() -> ssl.SSLContext:
+    global _SHARED_SSL_CTX
+    if _SHARED_SSL_CTX is None:
+        ctx = ssl.create_default_context()
+        ctx.check_hostname = False
+        ctx.verify_mode = ssl.CERT_NONE
+        _SHARED_SSL_CTX = ctx
+    return _SHARED_SSL_CTX
+
+
+# Delivered to every waiter when the connection drops; shared, so read-only
+_FATAL_RESP = {
+    "type": "!fatal", "kind": Reply.FATAL, "tag": None, "attrs": {"message": "disconnected"},
+}
 
 
 class APIError(Exception):
@@ -37,6 +63,99 @@ class APIError(Exception):
         self.category = category
 
 
+@lru_cache(maxsize=256)
+def _command_prefix(path: str, queries: tuple[str, ...]) -> bytes:
+    """Encoded words of a parameterless command, everything but the .tag trailer."""
+    return build_sentence([path, *queries])[:-1]
+
+
+class _Pending:
+    """
+    Reply slot for one tag. command() collects !re rows into `rows` and
+    resolves `fut` on !done; _read_one() (rows=None) resolves `fut` with the
+    first reply; stream() sets `stream_q` and gets every reply queued.
+    """
+    __slots__ = ("fut", "rows", "stream_q")
+
+    def __init__(
+        self,
+        fut: Optional[asyncio.Future] = None,
+        rows: Optional[list[dict]] = None,
+        stream_q: Optional[asyncio.Queue] = None,
+    ):
+        self.fut = fut
+        self.rows = rows
+        self.stream_q = stream_q
+
+    def deliver(self, resp: dict) -> None:
+        if self.stream_q is not None:
+            self.stream_q.put_nowait(resp)
+            return
+        fut = self.fut
+        if fut.done():
+            return  # e.g. the !done that follows a !trap
+        if self.rows is None:
+            fut.set_result(resp)
+            return
+        match resp["kind"]:
+            case Reply.RE:
+                self.rows.append(resp["attrs"])
+            case Reply.DONE:
+                fut.set_result(self.rows)
+            case Reply.TRAP | Reply.FATAL:
+                msg = resp["attrs"].get("message", str(resp["attrs"]))
+                cat = resp["attrs"].get("category", "")
+                fut.set_exception(APIError(msg, cat))
+
+
+class _RouterProtocol(asyncio.BufferedProtocol):
+    """
+    Socket reads land directly in the client's receive buffer (no bytes
+    object per read); complete sentences are dispatched as they arrive.
+    """
+
+    def __init__(self, client: "RouterAPIClient", gen: int):
+        self._client = client
+        self._gen = gen
+        self._paused = False
+        self._drain_waiter: Optional[asyncio.Future] = None
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        return self._client._recv_space()
+
+    def buffer_updated(self, nbytes: int) -> None:
+        if self._client._conn_gen == self._gen:
+            self._client._recv_end += nbytes
+            self._client._dispatch_buf()
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self._wake_writer(exc or ConnectionError("Connection lost"))
+        self._client._on_connection_lost(self._gen, exc)
+
+    # Write-side flow control (what StreamWriter.drain() did)
+
+    def pause_writing(self) -> None:
+        self._paused = True
+
+    def resume_writing(self) -> None:
+        self._paused = False
+        self._wake_writer(None)
+
+    def _wake_writer(self, exc: Optional[Exception]) -> None:
+        waiter, self._drain_waiter = self._drain_waiter, None
+        if waiter is not None and not waiter.done():
+            if exc is None:
+                waiter.set_result(None)
+            else:
+                waiter.set_exception(exc)
+
+    async def drain(self) -> None:
+        if self._paused:
+            if self._drain_waiter is None:
+                self._drain_waiter = asyncio.get_running_loop().create_future()
+            await self._drain_waiter
+
+
 class RouterAPIClient:
     """
     Thread-safe async RouterOS API client.
@@ -67,47 +186,58 @@ class RouterAPIClient:
         self.timeout = timeout
         self.use_ssl = use_ssl
         self.ros_version = ros_version
-
-        self._reader: Optional[asyncio.StreamReader] = None
-        self._writer: Optional[asyncio.StreamWriter] = None
+        # Called with the path after every non-/print command completes, so
+        # the owner can drop cached reads (see RouterROS6._invalidate)
+        self.on_write: Optional[Callable[[str], None]] = None
+        # Credential words never change for a client, so encode them once
+        self._login_name = encode_word(f"=name={username}")
+        self._login_password = encode_word(f"=password={password}")
+
+        self._transport: Optional[asyncio.Transport] = None
+        self._protocol: Optional[_RouterProtocol] = None
         self._connected = False
-        self._lock = asyncio.Lock()
+        # Sentences written in the same loop iteration go out as one write
+        self._send_queue: list[bytes] = []
+        self._send_scheduled = False
         self._tag_counter = 0
-        # tag -> asyncio.Queue for multiplexed responses
-        self._pending: dict[int, asyncio.Queue] = {}
-        self._recv_task: Optional[asyncio.Task] = None
-        self._buf = b""
-        # Incremented on each connect() so stale receiver loops don't
-        # overwrite _connected after a fresh connection is established.
+        # tag -> reply slot for multiplexed responses
+        self._pending: dict[int, _Pending] = {}
+        # Receive buffer: socket reads fill _buf[_recv_end:], decoding consumes
+        # from _recv_start; the unconsumed tail slides to the front between reads
+        self._buf = bytearray(_RECV_BUF)
+        self._recv_start = 0
+        self._recv_end = 0
+        # Incremented on each connect() so a stale transport's connection_lost
+        # doesn't overwrite _connected after a fresh connection is established.
         self._conn_gen = 0
 
     # ─── Connection ───────────────────────────────────────────────────────────
 
     async def connect(self) -> bool:
         try:
-            ssl_ctx = None
-            if self.use_ssl:
-                import ssl
-                ssl_ctx = ssl.create_default_context()
-                ssl_ctx.check_hostname = False
-                ssl_ctx.verify_mode = ssl.CERT_NONE
-
-            self._reader, self._writer = await asyncio.wait_for(
-                asyncio.open_connection(self.host, self.port, ssl=ssl_ctx),
-                timeout=self.timeout,
-            )
-            self._connected = True
-            self._buf = b""
+            ssl_ctx = _get_ssl_ctx() if self.use_ssl else None
+
             self._conn_gen += 1
             my_gen = self._conn_gen
-
-            # Start background receiver
-            self._recv_task = asyncio.create_task(self._receiver_loop(my_gen))
+            if self._transport is not None:
+                self._transport.abort()
+            self._buf = bytearray(_RECV_BUF)
+            self._recv_start = self._recv_end = 0
+            self._send_queue.clear()
+
+            loop = asyncio.get_running_loop()
+            async with asyncio.timeout(self.timeout):
+                self._transport, self._protocol = await loop.create_connection(
+                    lambda: _RouterProtocol(self, my_gen),
+                    self.host, self.port, ssl=ssl_ctx,
+                )
+            self._tune_socket()
+            self._connected = True
 
             # Authenticate
             await self._login()
 
-            # Verify the receiver loop didn't crash during login
+            # Verify the connection didn't drop during login
             if not self._connected or self._conn_gen != my_gen:
                 log.warning(f"Connection lost during login to {self.host}:{self.port}")
                 return False
@@ -118,18 +248,26 @@ class RouterAPIClient:
         except Exception as e:
             log.warning(f"Cannot connect to {self.host}:{self.port}: {e}")
             self._connected = False
+            # e.g. rejected login: don't leave a half-open transport accepting sends
+            if self._transport is not None:
+                self._transport.abort()
             return False
 
+    def _tune_socket(self) -> None:
+        """Request/response traffic: no Nagle delay, and room for reply bursts."""
+        sock = self._transport.get_extra_info("socket")
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _SO_RCVBUF)
+        except OSError as e:
+            log.debug(f"Socket tuning failed for {self.host}: {e}")
+
     async def close(self):
         self._connected = False
-        if self._recv_task:
-            self._recv_task.cancel()
-        if self._writer:
-            try:
-                self._writer.close()
-                await self._writer.wait_closed()
-            except Exception:
-                pass
+        if self._transport:
+            self._transport.close()
 
     @property
     def connected(self) -> bool:
@@ -146,53 +284,47 @@ class RouterAPIClient:
     async def _login_ros6(self):
         """ROS6: two-step MD5 challenge login."""
         tag = self._next_tag()
-        await self._send_raw(build_sentence(["/login", f".tag={tag}"]))
+        await self._send_raw(self._login_sentence(tag))
         resp = await self._read_one(tag)
-        if resp["type"] == "!trap":
+        if resp["kind"] == Reply.TRAP:
             raise APIError(f"Login rejected: {resp['attrs']}")
 
         challenge = resp["attrs"].get("ret", "")
         digest = md5_challenge_response(self.password, challenge)
 
         tag2 = self._next_tag()
-        await self._send_raw(build_sentence([
-            "/login",
-            f"=name={self.username}",
-            f"=response=00{digest}",
-            f".tag={tag2}",
-        ]))
+        await self._send_raw(self._login_sentence(
+            tag2, self._login_name, encode_word(f"=response=00{digest}"),
+        ))
         resp2 = await self._read_one(tag2)
-        if resp2["type"] == "!trap":
+        if resp2["kind"] == Reply.TRAP:
             raise APIError(f"Authentication failed: {resp2['attrs']}")
 
     async def _login_ros7(self):
         """ROS7: single-step plain+MD5 login (tries plain first)."""
         tag = self._next_tag()
-        await self._send_raw(build_sentence([
-            "/login",
-            f"=name={self.username}",
-            f"=password={self.password}",
-            f".tag={tag}",
-        ]))
+        await self._send_raw(self._login_sentence(tag, self._login_name, self._login_password))
         resp = await self._read_one(tag)
-        if resp["type"] == "!trap":
+        if resp["kind"] == Reply.TRAP:
             # Fallback to MD5 (some ROS7 configs require it)
             challenge = resp["attrs"].get("ret", "")
             if challenge:
                 digest = md5_challenge_response(self.password, challenge)
                 tag2 = self._next_tag()
-                await self._send_raw(build_sentence([
-                    "/login",
-                    f"=name={self.username}",
-                    f"=response=00{digest}",
-                    f".tag={tag2}",
-                ]))
+                await self._send_raw(self._login_sentence(
+                    tag2, self._login_name, encode_word(f"=response=00{digest}"),
+                ))
                 resp2 = await self._read_one(tag2)
-                if resp2["type"] == "!trap":
+                if resp2["kind"] == Reply.TRAP:
                     raise APIError(f"Authentication failed: {resp2['attrs']}")
             else:
                 raise APIError(f"Authentication failed: {resp['attrs']}")
 
+    @staticmethod
+    def _login_sentence(tag: int, *words: bytes) -> bytes:
+        """/login sentence from pre-encoded words; only the .tag word is encoded here."""
+        return b"".join((_LOGIN_WORD, *words, encode_word(f".tag={tag}"), b"\x00"))
+
     # ─── Command Execution ────────────────────────────────────────────────────
 
     async def command(
@@ -200,33 +332,75 @@ class RouterAPIClient:
         path: str,
         params: dict | None = None,
         queries: list[str] | None = None,
+        proplist: list[str] | None = None,
     ) -> list[dict]:
-        """Execute a command and return all !re responses."""
+        """
+        Execute a command and return all !re responses. `proplist` limits the
+        columns the router sends back (=.proplist=a,b).
+        """
+        if proplist:
+            params = {**(params or {}), ".proplist": ",".join(proplist)}
         tag = self._next_tag()
-        words = self._build_words(path, params, queries, tag)
+        return await self._run(path, tag, self._encode_command(path, params, queries, tag))
 
-        q: asyncio.Queue = asyncio.Queue()
-        self._pending[tag] = q
+    async def command_words(self, path: str, *words: str) -> list[dict]:
+        """
+        command() with ready-made attribute words, e.g. ("=numbers=*1",) —
+        skips building a params dict and converting it back to words.
+        """
+        tag = self._next_tag()
+        return await self._run(path, tag, build_sentence([path, *words, f".tag={tag}"]))
+
+    async def _run(self, path: str, tag: int, data: bytes) -> list[dict]:
+        p = self._pending[tag] = self._rows_slot()
 
         try:
-            async with self._lock:
-                await self._send_raw(build_sentence(words))
+            await self._send_raw(data)
+            return await self._wait_rows(p)
 
-            results = []
-            while True:
-                resp = await asyncio.wait_for(q.get(), timeout=self.timeout)
-                if resp["type"] == "!re":
-                    results.append(resp["attrs"])
-                elif resp["type"] == "!done":
-                    break
-                elif resp["type"] in ("!trap", "!fatal"):
-                    msg = resp["attrs"].get("message", str(resp["attrs"]))
-                    cat = resp["attrs"].get("category", "")
-                    raise APIError(msg, cat)
+        finally:
+            self._pending.pop(tag, None)
+            if self.on_write is not None and not path.endswith("/print"):
+                self.on_write(path)
+
+    async def command_batch(
+        self,
+        commands: list[tuple[str, dict | None]],
+    ) -> list[list[dict] | APIError]:
+        """
+        Pipeline several commands in one write and return their results in order.
+        A command that fails yields its APIError in place of a result list, so
+        one !trap does not discard the other replies.
+        """
+        tags = []
+        slots = []
+        data = []
+        for path, params in commands:
+            tag = self._next_tag()
+            tags.append(tag)
+            # Kept locally: a dropped connection clears _pending mid-batch
+            p = self._pending[tag] = self._rows_slot()
+            slots.append(p)
+            data.append(self._encode_command(path, params, None, tag))
+
+        try:
+            await self._send_raw(b"".join(data))
+
+            results: list[list[dict] | APIError] = []
+            for p in slots:
+                try:
+                    results.append(await self._wait_rows(p))
+                except APIError as e:
+                    results.append(e)
             return results
 
         finally:
-            self._pending.pop(tag, None)
+            for tag in tags:
+                self._pending.pop(tag, None)
+            if self.on_write is not None:
+                for path, _ in commands:
+                    if not path.endswith("/print"):
+                        self.on_write(path)
 
     async def stream(
         self,
@@ -235,39 +409,45 @@ class RouterAPIClient:
         queries: list[str] | None = None,
     ) -> AsyncIterator[dict]:
         """
-        Stream !re responses (for follow=yes commands).
-        Yields attr dicts until cancelled or connection drops.
+        Stream !re responses (for follow=yes commands, or to consume a long
+        finite reply row by row). Yields attr dicts until !done, cancellation
+        or the connection drops.
         """
         tag = self._next_tag()
-        words = self._build_words(path, params, queries, tag)
+        data = self._encode_command(path, params, queries, tag)
 
         q: asyncio.Queue = asyncio.Queue()
-        self._pending[tag] = q
+        self._pending[tag] = _Pending(stream_q=q)
+        finished = False
 
         try:
-            async with self._lock:
-                await self._send_raw(build_sentence(words))
+            await self._send_raw(data)
 
             while True:
-                resp = await asyncio.wait_for(q.get(), timeout=60.0)
-                if resp["type"] == "!re":
+                async with asyncio.timeout(60.0):
+                    resp = await q.get()
+                kind = resp["kind"]
+                if kind == Reply.RE:
                     yield resp["attrs"]
-                elif resp["type"] == "!done":
+                elif kind == Reply.DONE:
+                    finished = True
                     break
-                elif resp["type"] in ("!trap", "!fatal"):
+                elif kind == Reply.TRAP or kind == Reply.FATAL:
+                    finished = True
                     msg = resp["attrs"].get("message", str(resp["attrs"]))
                     raise APIError(msg)
         finally:
-            # Send /cancel to stop the streaming command
-            try:
-                cancel_tag = self._next_tag()
-                await self._send_raw(build_sentence([
-                    "/cancel",
-                    f"=tag={tag}",
-                    f".tag={cancel_tag}",
-                ]))
-            except Exception:
-                pass
+            # Send /cancel to stop the streaming command, unless the router already ended it
+            if not finished:
+                try:
+                    cancel_tag = self._next_tag()
+                    await self._send_raw(build_sentence([
+                        "/cancel",
+                        f"=tag={tag}",
+                        f".tag={cancel_tag}",
+                    ]))
+                except Exception:
+                    pass
             self._pending.pop(tag, None)
 
     async def command_one(self, path: str, params: dict | None = None) -> dict | None:
@@ -277,9 +457,50 @@ class RouterAPIClient:
 
     # ─── Internal ─────────────────────────────────────────────────────────────
 
+    @staticmethod
+    def _rows_slot() -> _Pending:
+        return _Pending(asyncio.get_running_loop().create_future(), [])
+
+    async def _wait_rows(self, p: _Pending) -> list[dict]:
+        """
+        Rows once !done arrives; raises APIError on !trap/!fatal. Times out
+        only after self.timeout passes with no new row, as a slow but
+        progressing reply (e.g. traceroute) must not be cut off.
+        """
+        seen = -1
+        while not p.fut.done():
+            if len(p.rows) == seen:
+                raise asyncio.TimeoutError()
+            seen = len(p.rows)
+            await asyncio.wait((p.fut,), timeout=self.timeout)
+        return p.fut.result()
+
     def _next_tag(self) -> int:
-        self._tag_counter = (self._tag_counter + 1) % 65535
-        return self._tag_counter
+        """Next 16-bit tag in 1..0xFFFF, skipping ones a long-lived stream still holds."""
+        tag = self._tag_counter
+        while True:
+            tag = (tag + 1) & 0xFFFF or 1
+            if tag not in self._pending:
+                self._tag_counter = tag
+                return tag
+
+    @classmethod
+    def _encode_command(
+        cls,
+        path: str,
+        params: dict | None,
+        queries: list[str] | None,
+        tag: int,
+    ) -> bytes:
+        """
+        Encoded sentence for a command. Parameterless commands (the /print
+        polls) reuse a cached prefix and only encode the .tag word; commands
+        with params aren't cached, so secrets in them aren't retained.
+        """
+        if params:
+            return build_sentence(cls._build_words(path, params, queries, tag))
+        prefix = _command_prefix(path, tuple(queries) if queries else ())
+        return prefix + encode_word(f".tag={tag}") + b"\x00"
 
     @staticmethod
     def _build_words(
@@ -301,82 +522,94 @@ class RouterAPIClient:
         return words
 
     async def _send_raw(self, data: bytes):
-        if not self._connected or self._writer is None:
+        # A lost, closed or aborted connection always leaves its transport closing
+        transport = self._transport
+        if transport is None or transport.is_closing():
             raise ConnectionError("Not connected")
-        self._writer.write(data)
-        await self._writer.drain()
+        self._send_queue.append(data)
+        if not self._send_scheduled:
+            self._send_scheduled = True
+            asyncio.get_running_loop().call_soon(self._flush_sends)
+        # Let the flush run first, so drain() sees this write's backpressure
+        await asyncio.sleep(0)
+        if transport.is_closing():
+            # Closed before the flush: the queued data was dropped, not sent
+            raise ConnectionError("Connection lost")
+        await self._protocol.drain()
+
+    def _flush_sends(self) -> None:
+        """Write every sentence queued this loop iteration in one transport write."""
+        self._send_scheduled = False
+        queue = self._send_queue
+        if not queue:
+            return
+        data = queue[0] if len(queue) == 1 else b"".join(queue)
+        queue.clear()
+        if self._transport is not None and not self._transport.is_closing():
+            self._transport.write(data)
 
     async def _read_one(self, tag: int) -> dict:
         """Wait for the next response for a specific tag (used during login)."""
-        q: asyncio.Queue = asyncio.Queue()
-        self._pending[tag] = q
+        fut = asyncio.get_running_loop().create_future()
+        self._pending[tag] = _Pending(fut)
         try:
-            resp = await asyncio.wait_for(q.get(), timeout=self.timeout)
-            return resp
+            async with asyncio.timeout(self.timeout):
+                return await fut
         finally:
             self._pending.pop(tag, None)
 
-    async def _receiver_loop(self, gen: int):
-        """Background task: reads bytes, decodes sentences, dispatches to queues."""
-        # WinError codes that are transient on Windows TCP sockets and can be retried
-        _TRANSIENT_WINERRORS = {64, 121, 995}
-        _MAX_TRANSIENT_RETRIES = 5
-        transient_retries = 0
-
-        try:
-            while self._connected and self._reader and self._conn_gen == gen:
-                try:
-                    chunk = await self._reader.read(_RECV_BUF)
-                except OSError as e:
-                    winerror = getattr(e, "winerror", None)
-                    if winerror in _TRANSIENT_WINERRORS and transient_retries < _MAX_TRANSIENT_RETRIES:
-                        transient_retries += 1
-                        log.debug(f"Transient socket error (retry {transient_retries}/{_MAX_TRANSIENT_RETRIES}): {e}")
-                        await asyncio.sleep(0.1)
-                        continue
-                    log.warning(f"Receiver loop error: {e}")
-                    break
-
-                if not chunk:
-                    break
-
-                transient_retries = 0  # reset on successful read
-                self._buf += chunk
-                self._dispatch_buf()
-
-        except asyncio.CancelledError:
-            pass
-        except Exception as e:
-            log.warning(f"Receiver loop error: {e}")
-        finally:
-            # Only mark disconnected if this loop still owns the current connection
-            if self._conn_gen == gen:
-                self._connected = False
-                # Unblock all waiters with fatal
-                for q in self._pending.values():
-                    await q.put({"type": "!fatal", "tag": None, "attrs": {"message": "disconnected"}})
+    def _recv_space(self) -> memoryview:
+        """Writable tail of the receive buffer for the next socket read."""
+        buf = self._buf
+        start, end = self._recv_start, self._recv_end
+        if start:
+            # Slide the unconsumed partial sentence to the front (same-size copy)
+            end -= start
+            buf[:end] = buf[start:self._recv_end]
+            self._recv_start, self._recv_end = 0, end
+        if len(buf) - end < _RECV_MIN_FREE:
+            # Grow into a new buffer: the transport may still hold a view of
+            # the old one, and an exported bytearray cannot be resized
+            grown = bytearray(2 * len(buf))
+            grown[:end] = buf[:end]
+            self._buf = buf = grown
+        return memoryview(buf)[end:]
+
+    def _on_connection_lost(self, gen: int, exc: Optional[Exception]) -> None:
+        # Only mark disconnected if this transport still owns the current connection
+        if self._conn_gen != gen:
+            return
+        if exc is not None:
+            log.warning(f"Connection to {self.host}:{self.port} lost: {exc}")
+        self._connected = False
+        # Unblock all waiters with fatal; nothing more can arrive for these tags
+        pending = list(self._pending.values())
+        self._pending.clear()
+        for p in pending:
+            p.deliver(_FATAL_RESP)
 
     def _dispatch_buf(self):
         """Extract complete sentences from buffer and dispatch."""
-        offset = 0
-        while offset < len(self._buf):
-            try:
-                words, new_offset = decode_sentence(self._buf, offset)
-            except BufferError:
-                break  # need more data
-
-            if not words:
-                offset += 1  # skip zero byte
-                continue
-
-            offset = new_offset
-            resp = parse_response(words)
-            tag = resp.get("tag")
-
-            if tag is not None and tag in self._pending:
-                self._pending[tag].put_nowait(resp)
+        # Released before returning so _recv_space() may resize the buffer
+        end = self._recv_end
+        with memoryview(self._buf)[:end] as view:
+            sentences, offset = decode_sentences(view, self._recv_start)
+        # Runs on every read from every router — keep lookups out of the loop
+        get_pending = self._pending.get
+        parse = parse_response
+        for words in sentences:
+            resp = parse(words)
+            p = get_pending(resp["tag"])
+            if p is not None:
+                p.deliver(resp)
             else:
                 # Untagged or unknown – log it
                 log.debug(f"Untagged response: {resp}")
 
-        self._buf = self._buf[offset:]
+        if offset == end:
+            self._recv_start = self._recv_end = 0
+            if len(self._buf) > _RECV_BUF:
+                # Give back what a large reply grew; an idle connection holds _RECV_BUF
+                self._buf = bytearray(_RECV_BUF)
+        else:
+            self._recv_start = offset
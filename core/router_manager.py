@@ -4,31 +4,59 @@ Router Manager – manages multiple router connections per user.
 CHANGES vs original:
   - _load_registry() / _save_registry() are now async, using asyncio.to_thread()
     to offload disk I/O off the event loop
-  - reconnect_all() now reconnects concurrently with asyncio.gather()
+  - reconnect_all() now reconnects concurrently in a TaskGroup, bounded by
+    a semaphore
   - Added iter_all_entries() public iterator so Monitor doesn't need to
     access private _entries (breaks tight coupling)
   - Added cleanup_user_status() hook so Monitor can remove stale cache
   - last_status dict moved out of Monitor and into RouterEntry for consistency
+  - Added iter_connected_entries() backed by an index maintained on
+    add/remove/reconnect, so the monitor doesn't rescan every entry per poll
+  - Registry is written atomically (temp file + os.replace) as compact JSON
+    bytes, and the write is skipped when the payload hasn't changed
+  - Registry saves are debounced: changes mark the registry dirty and one
+    flush runs SAVE_DEBOUNCE seconds later; flush() forces it on shutdown
+  - get_active() reads a flat user_id -> router map kept in step with the
+    active alias, instead of chaining lookups through _entries per command
+  - reconnect_all() backs off per router: after N consecutive failures an
+    entry is skipped until RECONNECT_DELAYS[N-1] seconds have passed
+  - Version auto-detection probes ROS7 and ROS6 concurrently
 """
 
 import asyncio
+import hashlib
 import json
 import logging
+import os
+import tempfile
+import time
 from pathlib import Path
-from typing import Optional, Iterator
+from typing import Optional, Iterator, ValuesView
 
 from .router_ros6 import RouterROS6
 from .router_ros7 import RouterROS7
 from .mock_router import MockRouter
 from .router_base import RouterBase
+from .api_protocol import dumpb
 from . import crypto
 
 log = logging.getLogger("RouterManager")
 
 REGISTRY_FILE = Path("data/routers.json")
+RECONNECT_CONCURRENCY = 16  # simultaneous connection attempts in reconnect_all()
+SAVE_DEBOUNCE = 0.2  # seconds to coalesce registry changes before writing
+# Seconds before retrying a router after 1, 2, … consecutive failed reconnects
+RECONNECT_DELAYS = [60, 120, 300, 600, 1800]
 
 
 class RouterEntry:
+    # Entries live for the lifetime of the bot — no per-instance __dict__
+    __slots__ = (
+        "alias", "host", "username", "password", "port", "use_ssl",
+        "ros_version", "standalone", "owner_id", "router", "detected_version",
+        "fail_count", "next_retry", "_enc_password",
+    )
+
     def __init__(
         self,
         alias: str,
@@ -52,13 +80,24 @@ class RouterEntry:
         self.owner_id = owner_id
         self.router: Optional[RouterBase] = None
         self.detected_version: int = 0
+        # Reconnect backoff — consecutive failures and monotonic time of next attempt
+        self.fail_count = 0
+        self.next_retry = 0.0
+        # (plaintext, ciphertext) of the last encryption — Fernet tokens are
+        # randomised, so re-encrypting on every save would change the payload
+        self._enc_password: Optional[tuple[str, str]] = None
+
+    def _encrypted_password(self) -> str:
+        if self._enc_password is None or self._enc_password[0] != self.password:
+            self._enc_password = (self.password, crypto.ensure_encrypted(self.password))
+        return self._enc_password[1]
 
     def to_dict(self) -> dict:
         return {
             "alias": self.alias,
             "host": self.host,
             "username": self.username,
-            "password": crypto.ensure_encrypted(self.password),
+            "password": self._encrypted_password(),
             "port": self.port,
             "use_ssl": self.use_ssl,
             "ros_version": self.ros_version,
@@ -69,8 +108,12 @@ class RouterEntry:
     @classmethod
     def from_dict(cls, d: dict) -> "RouterEntry":
         d = dict(d)  # don't mutate the source
-        d["password"] = crypto.safe_decrypt(d.get("password", ""))
-        return cls(**d)
+        stored = d.get("password", "")
+        d["password"] = crypto.safe_decrypt(stored)
+        entry = cls(**d)
+        if stored and crypto.is_encrypted(stored):
+            entry._enc_password = (entry.password, stored)
+        return entry
 
 
 class RouterManager:
@@ -81,8 +124,19 @@ class RouterManager:
         self._entries: dict[int, dict[str, RouterEntry]] = {}
         # user_id -> active alias
         self._active: dict[int, str] = {}
+        # user_id -> router of the active entry (hot path for get_active)
+        self._active_router: dict[int, RouterBase] = {}
+        # (user_id, alias) -> (user_id, alias, entry) for entries with a live router
+        self._connected: dict[tuple[int, str], tuple[int, str, RouterEntry]] = {}
         # Serialises registry writes to prevent concurrent write corruption
         self._write_lock = asyncio.Lock()
+        # Digest of the last payload written, so unchanged saves are skipped
+        self._registry_digest: bytes = b""
+        # Debounced save state — see _schedule_save()
+        self._dirty = False
+        self._save_task: Optional[asyncio.Task] = None
+        # Caps concurrent handshakes so a mass reconnect doesn't starve live commands
+        self._reconnect_sem = asyncio.Semaphore(RECONNECT_CONCURRENCY)
         # Optional Monitor reference — set via set_monitor()
         self._monitor = None
         # Synchronous load only during __init__ (before the event loop starts)
@@ -95,7 +149,7 @@ class RouterManager:
         if not REGISTRY_FILE.exists():
             return
         try:
-            data = json.loads(REGISTRY_FILE.read_text())
+            data = json.loads(REGISTRY_FILE.read_bytes())
             for uid_str, routers in data.items():
                 uid = int(uid_str)
                 self._entries[uid] = {}
@@ -111,15 +165,40 @@ class RouterManager:
         }
 
     async def _save_registry(self) -> None:
-        """Non-blocking async registry save."""
+        """Non-blocking async registry save; no-op if nothing changed."""
         async with self._write_lock:
-            payload = self._build_registry_payload()
-            await asyncio.to_thread(
-                lambda: (
-                    REGISTRY_FILE.parent.mkdir(parents=True, exist_ok=True),
-                    REGISTRY_FILE.write_text(json.dumps(payload, indent=2)),
-                )
-            )
+            data = dumpb(self._build_registry_payload())
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            if digest == self._registry_digest:
+                return
+            await asyncio.to_thread(_write_registry_sync, data)
+            self._registry_digest = digest
+
+    def _schedule_save(self) -> None:
+        """Mark the registry dirty and make sure a delayed flush is pending."""
+        self._dirty = True
+        if self._save_task is None:
+            self._save_task = asyncio.create_task(self._delayed_flush())
+
+    async def _delayed_flush(self) -> None:
+        await asyncio.sleep(SAVE_DEBOUNCE)
+        # Changes made while this flush is writing schedule a fresh one
+        self._save_task = None
+        try:
+            await self.flush()
+        except Exception as e:
+            log.error(f"Failed to save registry: {e}")
+
+    async def flush(self) -> None:
+        """Write pending registry changes now (called on shutdown)."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        try:
+            await self._save_registry()
+        except BaseException:
+            self._dirty = True
+            raise
 
     # ─── Public Iterator (replaces direct _entries access) ────────────────────
 
@@ -127,10 +206,24 @@ class RouterManager:
         """
         Yields (user_id, alias, RouterEntry) for every registered router.
         Use this instead of accessing _entries directly.
+
+        Only the user ids are snapshotted; a caller must not await between
+        items, or a concurrent add/remove can break the inner iteration.
+        """
+        entries = self._entries
+        for uid in tuple(entries):
+            routers = entries.get(uid)
+            if routers:
+                for alias, entry in routers.items():
+                    yield uid, alias, entry
+
+    def iter_connected_entries(self) -> ValuesView[tuple[int, str, RouterEntry]]:
         """
-        for uid, routers in list(self._entries.items()):
-            for alias, entry in list(routers.items()):
-                yield uid, alias, entry
+        (user_id, alias, RouterEntry) for every router that has connected.
+        Live view — don't hold it across an await. The transport can still
+        drop underneath, so callers should check entry.router.connected.
+        """
+        return self._connected.values()
 
     # ─── Router CRUD ──────────────────────────────────────────────────────────
 
@@ -164,11 +257,13 @@ class RouterManager:
             self._entries[user_id] = {}
 
         self._entries[user_id][alias] = entry
+        self._connected[(user_id, alias)] = (user_id, alias, entry)
 
         if user_id not in self._active:
             self._active[user_id] = alias
+        self._sync_active_router(user_id)
 
-        await self._save_registry()
+        self._schedule_save()
         return True, f"✅ Connected to {host} (RouterOS {version}) as `{alias}`"
 
     async def remove_router(self, user_id: int, alias: str) -> bool:
@@ -178,18 +273,21 @@ class RouterManager:
         if entry.router:
             await entry.router.close()
         del self._entries[user_id][alias]
+        self._connected.pop((user_id, alias), None)
         if self._active.get(user_id) == alias:
             remaining = list(self._entries.get(user_id, {}).keys())
             self._active[user_id] = remaining[0] if remaining else None
+            self._sync_active_router(user_id)
         # Notify monitor to clean up alert state cache
         if self._monitor:
             self._monitor.on_router_removed(user_id, alias)
-        await self._save_registry()
+        self._schedule_save()
         return True
 
     def switch_router(self, user_id: int, alias: str) -> bool:
         if user_id in self._entries and alias in self._entries[user_id]:
             self._active[user_id] = alias
+            self._sync_active_router(user_id)
             return True
         return False
 
@@ -211,13 +309,7 @@ class RouterManager:
     # ─── Active Router Access ─────────────────────────────────────────────────
 
     def get_active(self, user_id: int) -> Optional[RouterBase]:
-        alias = self._active.get(user_id)
-        if not alias:
-            return None
-        entry = self._entries.get(user_id, {}).get(alias)
-        if not entry or not entry.router:
-            return None
-        return entry.router
+        return self._active_router.get(user_id)
 
     def get_active_entry(self, user_id: int) -> Optional[RouterEntry]:
         alias = self._active.get(user_id)
@@ -228,72 +320,110 @@ class RouterManager:
     def has_routers(self, user_id: int) -> bool:
         return bool(self._entries.get(user_id))
 
+    def _sync_active_router(self, user_id: int) -> None:
+        """Refresh _active_router[user_id] after the active alias or its router changed."""
+        entry = self.get_active_entry(user_id)
+        if entry and entry.router:
+            self._active_router[user_id] = entry.router
+        else:
+            self._active_router.pop(user_id, None)
+
     # ─── Connection ───────────────────────────────────────────────────────────
 
     async def _create_and_connect(self, entry: RouterEntry) -> tuple[Optional[RouterBase], int]:
         """Auto-detect ROS version and connect. Returns (router, version)."""
-        versions_to_try: list[int] = (
-            [entry.ros_version] if entry.ros_version in (6, 7) else [7, 6]
-        )
+        if entry.ros_version in (6, 7):
+            return await self._try_version(entry, entry.ros_version)
 
-        for ver in versions_to_try:
-            try:
-                router: RouterBase = (
-                    RouterROS7(
-                        host=entry.host, username=entry.username,
-                        password=entry.password, port=entry.port,
-                        use_ssl=entry.use_ssl, standalone=entry.standalone,
-                    )
-                    if ver == 7
-                    else RouterROS6(
-                        host=entry.host, username=entry.username,
-                        password=entry.password, port=entry.port,
-                        use_ssl=entry.use_ssl,
+        # Probe both at once so a ROS6-only device doesn't wait out the ROS7
+        # attempt first. ROS7 still wins whenever it succeeds.
+        t7 = asyncio.create_task(self._try_version(entry, 7))
+        t6 = asyncio.create_task(self._try_version(entry, 6))
+        try:
+            router, ver = await t7
+        except BaseException:
+            t6.cancel()
+            raise
+        if router:
+            t6.cancel()
+            await asyncio.wait((t6,))
+            if not t6.cancelled() and t6.result()[0]:
+                await t6.result()[0].close()
+            return router, ver
+        return await t6
+
+    async def _try_version(self, entry: RouterEntry, ver: int) -> tuple[Optional[RouterBase], int]:
+        """One connection attempt as ROS `ver`. Closes the router unless it's returned."""
+        router: RouterBase = (
+            RouterROS7(
+                host=entry.host, username=entry.username,
+                password=entry.password, port=entry.port,
+                use_ssl=entry.use_ssl, standalone=entry.standalone,
+            )
+            if ver == 7
+            else RouterROS6(
+                host=entry.host, username=entry.username,
+                password=entry.password, port=entry.port,
+                use_ssl=entry.use_ssl,
+            )
+        )
+        try:
+            if await router.connect():
+                res = await router.get_system_resource()
+                if res:
+                    detected = (
+                        7 if "ros-version" in res and "7" in str(res.get("ros-version", ""))
+                        else ver
                     )
-                )
-
-                ok = await router.connect()
-                if ok:
-                    res = await router.get_system_resource()
-                    if res:
-                        detected = (
-                            7 if "ros-version" in res and "7" in str(res.get("ros-version", ""))
-                            else ver
-                        )
-                        return router, detected
-                    await router.close()
-            except Exception as e:
-                log.debug(f"Failed with ROS{ver}: {e}")
-                continue
-
+                    return router, detected
+        except asyncio.CancelledError:
+            await router.close()
+            raise
+        except Exception as e:
+            log.debug(f"Failed with ROS{ver}: {e}")
+        await router.close()
         return None, 0
 
     async def reconnect_all(self) -> None:
         """
-        Reconnect all disconnected routers concurrently.
-        Previously sequential — now uses asyncio.gather() so N routers
-        each timing out at 10s costs 10s total, not N×10s.
+        Reconnect all disconnected routers concurrently, at most
+        RECONNECT_CONCURRENCY at a time — N routers each timing out at 10s
+        cost ~10s per RECONNECT_CONCURRENCY, not N×10s.
         """
-        tasks = []
-        for uid, alias, entry in self.iter_all_entries():
-            if not entry.router or not entry.router.connected:
-                tasks.append(self._reconnect_one(uid, alias, entry))
-
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+        now = time.monotonic()
+        async with asyncio.TaskGroup() as tg:
+            for uid, alias, entry in self.iter_all_entries():
+                if entry.router and entry.router.connected:
+                    continue
+                if now < entry.next_retry:
+                    continue
+                tg.create_task(self._reconnect_one(uid, alias, entry))
 
     async def _reconnect_one(self, uid: int, alias: str, entry: RouterEntry) -> None:
-        log.info(f"Reconnecting {entry.host} ({alias}) for user {uid}")
-        try:
-            router, ver = await self._create_and_connect(entry)
-            if router:
-                entry.router = router
-                entry.detected_version = ver
-                log.info(f"Reconnected {alias} ({entry.host}) ROS{ver}")
-            else:
+        # Never raises — reconnect_all()'s TaskGroup would cancel the siblings
+        async with self._reconnect_sem:
+            log.info(f"Reconnecting {entry.host} ({alias}) for user {uid}")
+            try:
+                router, ver = await self._create_and_connect(entry)
+                if router:
+                    if self._entries.get(uid, {}).get(alias) is not entry:
+                        # Removed while we were connecting — nothing owns this one
+                        await router.close()
+                        return
+                    entry.router = router
+                    entry.detected_version = ver
+                    entry.fail_count = 0
+                    entry.next_retry = 0.0
+                    self._connected[(uid, alias)] = (uid, alias, entry)
+                    self._sync_active_router(uid)
+                    log.info(f"Reconnected {alias} ({entry.host}) ROS{ver}")
+                    return
                 log.warning(f"Reconnect failed for {alias} ({entry.host})")
-        except Exception as e:
-            log.warning(f"Reconnect error for {alias}: {e}")
+            except Exception as e:
+                log.warning(f"Reconnect error for {alias}: {e}")
+            entry.fail_count += 1
+            delay = RECONNECT_DELAYS[min(entry.fail_count, len(RECONNECT_DELAYS)) - 1]
+            entry.next_retry = time.monotonic() + delay
 
     async def get_or_mock(self, user_id: int) -> RouterBase:
         """Return active router or a mock (for development)."""
@@ -301,3 +431,18 @@ class RouterManager:
         if router and router.connected:
             return router
         return MockRouter()
+
+
+def _write_registry_sync(data: bytes) -> None:
+    """Atomically replace routers.json: temp file in the same dir, fsync, rename."""
+    REGISTRY_FILE.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=REGISTRY_FILE.parent, prefix=".routers-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, REGISTRY_FILE)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
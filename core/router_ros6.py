@@ -5,14 +5,56 @@ ROS6 does not support Docker containers.
 """
 
 import asyncio
+import functools
+from collections import deque
 import logging
+import time
 from typing import AsyncIterator
 
-from .router_base import RouterBase
+from .router_base import RouterBase, batch_by_time
 from .router_client import RouterAPIClient, APIError
 
 log = logging.getLogger("ROS6")
 
+READ_CACHE_TTL = 3.0  # seconds a cached /print result is served for
+# Columns the address-list views and search actually read
+_ADDRLIST_PROPS = [".id", "list", "address", "comment", "timeout"]
+
+
+def _typed_ifaces(rows: list[dict]) -> list[dict]:
+    """Parse the running/disabled flags of /interface/print rows to bools, in place."""
+    for row in rows:
+        for key in ("running", "disabled"):
+            # rows from a shared read may already be converted
+            if isinstance(row.get(key), str):
+                row[key] = row[key] == "true"
+    return rows
+
+
+def _ttl_cache(seconds: float = READ_CACHE_TTL):
+    """
+    Cache an idempotent getter's result per router for `seconds`. Concurrent
+    callers that miss share one in-flight request. Any write through the
+    client clears the cache. Cached lists/dicts are shared — treat as read-only.
+    """
+    def deco(fn):
+        name = fn.__name__
+
+        @functools.wraps(fn)
+        async def wrapper(self, *args, **kwargs):
+            key = (name, args, frozenset(kwargs.items()))
+            now = time.monotonic()
+            hit = self._cache.get(key)
+            if hit is None or hit[0] <= now:
+                # Own task, so a cancelled caller doesn't cancel the others' fetch
+                task = asyncio.ensure_future(fn(self, *args, **kwargs))
+                hit = self._cache[key] = (now + seconds, task)
+                task.add_done_callback(functools.partial(self._cache_done, key, hit))
+            return await asyncio.shield(hit[1])
+
+        return wrapper
+    return deco
+
 
 class RouterROS6(RouterBase):
 
@@ -22,6 +64,77 @@ class RouterROS6(RouterBase):
             port=port, use_ssl=use_ssl, ros_version=6,
         )
         self.host = host
+        # _ttl_cache: (method, args, kwargs) -> (expires_at, task fetching the result)
+        self._cache: dict[tuple, tuple[float, asyncio.Future]] = {}
+        # _read: (path, queries) -> task of the identical /print already in flight
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        self._client.on_write = self._invalidate
+
+    def _invalidate(self, path: str = "") -> None:
+        """Drop every cached read — cheaper than working out what a write touched."""
+        self._cache.clear()
+        # A /print sent before the write may predate it; callers already
+        # waiting keep their task, later reads send a fresh request
+        self._inflight.clear()
+
+    async def _read(
+        self,
+        path: str,
+        queries: list[str] | None = None,
+        proplist: list[str] | None = None,
+    ) -> list[dict]:
+        """
+        Idempotent /print. Concurrent identical reads share one request
+        (single-flight); the rows are shared, so treat them as read-only.
+        """
+        key = (path, tuple(queries or ()), tuple(proplist or ()))
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.ensure_future(
+                self._client.command(path, queries=queries, proplist=proplist)
+            )
+            task.add_done_callback(functools.partial(self._read_done, key))
+        return await asyncio.shield(task)
+
+    async def _read_one(
+        self,
+        path: str,
+        queries: list[str] | None = None,
+        proplist: list[str] | None = None,
+    ) -> dict | None:
+        rows = await self._read(path, queries, proplist)
+        return rows[0] if rows else None
+
+    async def _by_numbers(self, path: str, ids: list[str]) -> int:
+        """
+        Run `path` on many items with one numbers=a,b,c command; returns how
+        many were applied. If the router refuses the batch (e.g. one id has
+        since vanished) it falls back to one command per id, so a stale id
+        doesn't block the rest. Errors are reported as by RouterBase._each.
+        """
+        if not ids:
+            return 0
+        try:
+            await self._client.command_words(path, "=numbers=" + ",".join(ids))
+            return len(ids)
+        except APIError:
+            pass
+        return await self._each(
+            lambda id_: self._client.command_words(path, f"=numbers={id_}"), ids
+        )
+
+    def _read_done(self, key: tuple, task: asyncio.Future) -> None:
+        # _invalidate may have replaced or dropped this entry meanwhile
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved even if every caller was cancelled
+
+    def _cache_done(self, key: tuple, hit: tuple, task: asyncio.Future) -> None:
+        # Failed fetches aren't cached: the next caller retries
+        if task.cancelled() or task.exception() is not None:
+            if self._cache.get(key) is hit:
+                del self._cache[key]
 
     # ─── Connection ───────────────────────────────────────────────────────────
 
@@ -37,24 +150,39 @@ class RouterROS6(RouterBase):
 
     # ─── System ───────────────────────────────────────────────────────────────
 
+    @_ttl_cache()
     async def get_system_resource(self) -> dict:
-        r = await self._client.command_one("/system/resource/print")
+        r = await self._read_one("/system/resource/print")
         return r or {}
 
+    async def get_monitor_snapshot(self) -> dict:
+        res, ifaces, leases = await self._client.command_batch([
+            ("/system/resource/print", None),
+            ("/interface/print", None),
+            ("/ip/dhcp-server/lease/print", None),
+        ])
+        if isinstance(res, list):
+            res = res[0] if res else {}
+        return {
+            "resource": None if isinstance(res, APIError) else res,
+            "interfaces": None if isinstance(ifaces, APIError) else _typed_ifaces(ifaces),
+            "leases": None if isinstance(leases, APIError) else leases,
+        }
+
     async def get_system_identity(self) -> str:
-        r = await self._client.command_one("/system/identity/print")
+        r = await self._read_one("/system/identity/print")
         return r.get("name", "unknown") if r else "unknown"
 
     async def get_system_routerboard(self) -> dict:
         try:
-            r = await self._client.command_one("/system/routerboard/print")
+            r = await self._read_one("/system/routerboard/print")
             return r or {}
         except APIError:
             return {}
 
     async def get_system_health(self) -> dict:
         try:
-            r = await self._client.command_one("/system/health/print")
+            r = await self._read_one("/system/health/print")
             return r or {}
         except APIError:
             return {}
@@ -67,14 +195,15 @@ class RouterROS6(RouterBase):
 
     # ─── Interfaces ───────────────────────────────────────────────────────────
 
+    @_ttl_cache()
     async def get_interfaces(self) -> list[dict]:
-        return await self._client.command("/interface/print")
+        return _typed_ifaces(await self._read("/interface/print"))
 
     async def enable_interface(self, name: str):
-        await self._client.command("/interface/enable", {"numbers": name})
+        await self._client.command_words("/interface/enable", f"=numbers={name}")
 
     async def disable_interface(self, name: str):
-        await self._client.command("/interface/disable", {"numbers": name})
+        await self._client.command_words("/interface/disable", f"=numbers={name}")
 
     async def get_interface_traffic(self, name: str, duration: int = 5) -> dict:
         results = await self._client.command(
@@ -86,7 +215,7 @@ class RouterROS6(RouterBase):
     # ─── IP Addresses ─────────────────────────────────────────────────────────
 
     async def get_ip_addresses(self) -> list[dict]:
-        return await self._client.command("/ip/address/print")
+        return await self._read("/ip/address/print")
 
     async def add_ip_address(self, address: str, interface: str) -> str:
         result = await self._client.command("/ip/address/add", {
@@ -95,46 +224,55 @@ class RouterROS6(RouterBase):
         return result[0].get("ret", "") if result else ""
 
     async def remove_ip_address(self, id_: str):
-        await self._client.command("/ip/address/remove", {"numbers": id_})
+        await self._client.command_words("/ip/address/remove", f"=numbers={id_}")
 
     # ─── Firewall ─────────────────────────────────────────────────────────────
 
     async def get_firewall_filter(self) -> list[dict]:
-        return await self._client.command("/ip/firewall/filter/print")
+        return await self._read("/ip/firewall/filter/print")
 
     async def add_firewall_filter(self, params: dict) -> str:
         r = await self._client.command("/ip/firewall/filter/add", params)
         return r[0].get("ret", "") if r else ""
 
     async def remove_firewall_rule(self, id_: str):
-        await self._client.command("/ip/firewall/filter/remove", {"numbers": id_})
+        await self._client.command_words("/ip/firewall/filter/remove", f"=numbers={id_}")
 
     async def enable_firewall_rule(self, id_: str):
-        await self._client.command("/ip/firewall/filter/enable", {"numbers": id_})
+        await self._client.command_words("/ip/firewall/filter/enable", f"=numbers={id_}")
 
     async def disable_firewall_rule(self, id_: str):
-        await self._client.command("/ip/firewall/filter/disable", {"numbers": id_})
+        await self._client.command_words("/ip/firewall/filter/disable", f"=numbers={id_}")
+
+    async def remove_firewall_rules(self, ids: list[str]) -> int:
+        return await self._by_numbers("/ip/firewall/filter/remove", ids)
+
+    async def enable_firewall_rules(self, ids: list[str]) -> int:
+        return await self._by_numbers("/ip/firewall/filter/enable", ids)
+
+    async def disable_firewall_rules(self, ids: list[str]) -> int:
+        return await self._by_numbers("/ip/firewall/filter/disable", ids)
 
     async def move_firewall_rule(self, id_: str, destination: int):
-        await self._client.command("/ip/firewall/filter/move", {
-            "numbers": id_, "destination": str(destination),
-        })
+        await self._client.command_words(
+            "/ip/firewall/filter/move", f"=numbers={id_}", f"=destination={destination}",
+        )
 
     async def get_firewall_nat(self) -> list[dict]:
-        return await self._client.command("/ip/firewall/nat/print")
+        return await self._read("/ip/firewall/nat/print")
 
     async def add_firewall_nat(self, params: dict) -> str:
         r = await self._client.command("/ip/firewall/nat/add", params)
         return r[0].get("ret", "") if r else ""
 
     async def get_firewall_mangle(self) -> list[dict]:
-        return await self._client.command("/ip/firewall/mangle/print")
+        return await self._read("/ip/firewall/mangle/print")
 
     async def get_address_list(self, list_name: str | None = None) -> list[dict]:
         queries = []
         if list_name:
             queries = [f"?list={list_name}"]
-        return await self._client.command("/ip/firewall/address-list/print", queries=queries)
+        return await self._read("/ip/firewall/address-list/print", queries, _ADDRLIST_PROPS)
 
     async def add_address_list_entry(self, address: str, list_name: str, comment: str = "") -> str:
         params = {"address": address, "list": list_name}
@@ -144,18 +282,25 @@ class RouterROS6(RouterBase):
         return r[0].get("ret", "") if r else ""
 
     async def remove_address_list_entry(self, id_: str):
-        await self._client.command("/ip/firewall/address-list/remove", {"numbers": id_})
+        await self._client.command_words("/ip/firewall/address-list/remove", f"=numbers={id_}")
+
+    async def remove_address_list_entries(self, ids: list[str]) -> int:
+        return await self._by_numbers("/ip/firewall/address-list/remove", ids)
 
     async def get_connection_tracking(self) -> list[dict]:
-        return await self._client.command("/ip/firewall/connection/print")
+        return await self._read("/ip/firewall/connection/print")
 
     # ─── DHCP ─────────────────────────────────────────────────────────────────
 
     async def get_dhcp_server(self) -> list[dict]:
-        return await self._client.command("/ip/dhcp-server/print")
+        return await self._read("/ip/dhcp-server/print")
 
+    @_ttl_cache()
     async def get_dhcp_leases(self) -> list[dict]:
-        return await self._client.command("/ip/dhcp-server/lease/print")
+        return await self._read("/ip/dhcp-server/lease/print")
+
+    async def get_dhcp_lease(self, id_: str) -> dict | None:
+        return await self._read_one("/ip/dhcp-server/lease/print", [f"?.id={id_}"])
 
     async def add_dhcp_static_lease(self, mac: str, ip: str, comment: str = "") -> str:
         params = {"mac-address": mac, "address": ip, "type": "static"}
@@ -165,28 +310,32 @@ class RouterROS6(RouterBase):
         return r[0].get("ret", "") if r else ""
 
     async def remove_dhcp_lease(self, id_: str):
-        await self._client.command("/ip/dhcp-server/lease/remove", {"numbers": id_})
+        await self._client.command_words("/ip/dhcp-server/lease/remove", f"=numbers={id_}")
+
+    async def remove_dhcp_leases(self, ids: list[str]) -> int:
+        return await self._by_numbers("/ip/dhcp-server/lease/remove", ids)
 
     async def make_dhcp_lease_static(self, id_: str):
-        await self._client.command("/ip/dhcp-server/lease/make-static", {"numbers": id_})
+        await self._client.command_words("/ip/dhcp-server/lease/make-static", f"=numbers={id_}")
 
     # ─── Wireless ─────────────────────────────────────────────────────────────
 
+    @_ttl_cache()
     async def get_wireless_interfaces(self) -> list[dict]:
         try:
-            return await self._client.command("/interface/wireless/print")
+            return await self._read("/interface/wireless/print")
         except APIError:
             return []
 
     async def get_wireless_registrations(self) -> list[dict]:
         try:
-            return await self._client.command("/interface/wireless/registration-table/print")
+            return await self._read("/interface/wireless/registration-table/print")
         except APIError:
             return []
 
     async def get_wireless_security_profiles(self) -> list[dict]:
         try:
-            return await self._client.command("/interface/wireless/security-profiles/print")
+            return await self._read("/interface/wireless/security-profiles/print")
         except APIError:
             return []
 
@@ -196,13 +345,14 @@ class RouterROS6(RouterBase):
         })
 
     async def set_wireless_password(self, interface: str, password: str):
-        # Get security profile for this interface first
-        ifaces = await self.get_wireless_interfaces()
-        profile_name = "default"
-        for i in ifaces:
-            if i.get("name") == interface:
-                profile_name = i.get("security-profile", "default")
-                break
+        # Get security profile for this interface first — just that one column
+        try:
+            row = await self._read_one(
+                "/interface/wireless/print", [f"?name={interface}"], ["security-profile"],
+            )
+        except APIError:
+            row = None
+        profile_name = row.get("security-profile", "default") if row else "default"
         await self._client.command("/interface/wireless/security-profiles/set", {
             "numbers": profile_name,
             "wpa2-pre-shared-key": password,
@@ -210,10 +360,10 @@ class RouterROS6(RouterBase):
         })
 
     async def enable_wireless(self, interface: str):
-        await self._client.command("/interface/wireless/enable", {"numbers": interface})
+        await self._client.command_words("/interface/wireless/enable", f"=numbers={interface}")
 
     async def disable_wireless(self, interface: str):
-        await self._client.command("/interface/wireless/disable", {"numbers": interface})
+        await self._client.command_words("/interface/wireless/disable", f"=numbers={interface}")
 
     async def disconnect_wireless_client(self, mac: str):
         await self._client.command("/interface/wireless/deauthenticate", {"mac-address": mac})
@@ -231,39 +381,39 @@ class RouterROS6(RouterBase):
 
     async def get_pppoe_server(self) -> list[dict]:
         try:
-            return await self._client.command("/interface/pppoe-server/server/print")
+            return await self._read("/interface/pppoe-server/server/print")
         except APIError:
             return []
 
     async def get_pppoe_active(self) -> list[dict]:
         try:
-            return await self._client.command("/interface/pppoe-server/active/print")
+            return await self._read("/interface/pppoe-server/active/print")
         except APIError:
             return []
 
     async def get_l2tp_server(self) -> dict:
         try:
-            r = await self._client.command_one("/interface/l2tp-server/server/print")
+            r = await self._read_one("/interface/l2tp-server/server/print")
             return r or {}
         except APIError:
             return {}
 
     async def get_ovpn_server(self) -> dict:
         try:
-            r = await self._client.command_one("/interface/ovpn-server/server/print")
+            r = await self._read_one("/interface/ovpn-server/server/print")
             return r or {}
         except APIError:
             return {}
 
     async def get_pptp_server(self) -> dict:
         try:
-            r = await self._client.command_one("/interface/pptp-server/server/print")
+            r = await self._read_one("/interface/pptp-server/server/print")
             return r or {}
         except APIError:
             return {}
 
     async def get_vpn_secrets(self) -> list[dict]:
-        return await self._client.command("/ppp/secret/print")
+        return await self._read("/ppp/secret/print")
 
     async def add_vpn_secret(self, name: str, password: str, service: str = "any", profile: str = "default") -> str:
         r = await self._client.command("/ppp/secret/add", {
@@ -273,15 +423,15 @@ class RouterROS6(RouterBase):
         return r[0].get("ret", "") if r else ""
 
     async def remove_vpn_secret(self, id_: str):
-        await self._client.command("/ppp/secret/remove", {"numbers": id_})
+        await self._client.command_words("/ppp/secret/remove", f"=numbers={id_}")
 
     # ─── File System ──────────────────────────────────────────────────────────
 
     async def get_files(self) -> list[dict]:
-        return await self._client.command("/file/print")
+        return await self._read("/file/print")
 
     async def delete_file(self, name: str):
-        await self._client.command("/file/remove", {"numbers": name})
+        await self._client.command_words("/file/remove", f"=numbers={name}")
 
     async def get_backup_file(self, name: str) -> bytes:
         """
@@ -297,16 +447,21 @@ class RouterROS6(RouterBase):
         if password:
             params["password"] = password
         await self._client.command("/system/backup/save", params)
-        # Find the created file
-        files = await self.get_files()
-        backup_files = [f for f in files if f.get("name", "").endswith(".backup")]
-        if backup_files:
-            return backup_files[-1].get("name", "backup.backup")
-        return name + ".backup" if name else "backup.backup"
+        if name:
+            # RouterOS appends the extension itself; no need to look the file up
+            return name if name.endswith(".backup") else name + ".backup"
+        # Auto-named: newest backup file — list order follows creation order
+        files = await self._client.command(
+            "/file/print", queries=["?type=backup"], proplist=["name"],
+        )
+        if files:
+            return files[-1].get("name", "backup.backup")
+        return "backup.backup"
 
     async def export_config(self) -> str:
-        results = await self._client.command("/export")
-        return "\n".join(r.get("ret", "") for r in results if r)
+        # Streamed so the full reply list is never held alongside the text
+        parts = [r.get("ret", "") async for r in self._client.stream("/export") if r]
+        return "\n".join(parts)
 
     # ─── Logs ─────────────────────────────────────────────────────────────────
 
@@ -314,20 +469,26 @@ class RouterROS6(RouterBase):
         queries = []
         if topics:
             queries = [f"?topics={topics}"]
-        results = await self._client.command("/log/print", queries=queries)
-        return results[-limit:]
-
-    async def stream_logs(self, topics: str = "") -> AsyncIterator[dict]:
+        # Only the newest `limit` rows are kept while the log streams in;
+        # limit <= 0 keeps the old rows[-limit:] meaning (0 = every row)
+        tail: deque[dict] = deque(maxlen=limit if limit > 0 else None)
+        async for row in self._client.stream("/log/print", queries=queries):
+            tail.append(row)
+        rows = list(tail)
+        return rows if limit > 0 else rows[-limit:]
+
+    async def stream_logs(self, topics: str = "") -> AsyncIterator[list[dict]]:
         params: dict = {"follow": ""}
         if topics:
             params["topics"] = topics
-        async for row in self._client.stream("/log/print", params):
-            yield row
+        async for batch in batch_by_time(self._client.stream("/log/print", params)):
+            yield batch
 
     # ─── Routing ──────────────────────────────────────────────────────────────
 
+    @_ttl_cache()
     async def get_routes(self) -> list[dict]:
-        return await self._client.command("/ip/route/print")
+        return await self._read("/ip/route/print")
 
     async def add_route(self, dst_address: str, gateway: str, distance: int = 1) -> str:
         r = await self._client.command("/ip/route/add", {
@@ -337,24 +498,24 @@ class RouterROS6(RouterBase):
         return r[0].get("ret", "") if r else ""
 
     async def remove_route(self, id_: str):
-        await self._client.command("/ip/route/remove", {"numbers": id_})
+        await self._client.command_words("/ip/route/remove", f"=numbers={id_}")
 
     # ─── ARP ──────────────────────────────────────────────────────────────────
 
     async def get_arp(self) -> list[dict]:
-        return await self._client.command("/ip/arp/print")
+        return await self._read("/ip/arp/print")
 
     # ─── DNS ──────────────────────────────────────────────────────────────────
 
     async def get_dns_settings(self) -> dict:
-        r = await self._client.command_one("/ip/dns/print")
+        r = await self._read_one("/ip/dns/print")
         return r or {}
 
     async def set_dns_servers(self, servers: list[str]):
         await self._client.command("/ip/dns/set", {"servers": ",".join(servers)})
 
     async def get_dns_cache(self) -> list[dict]:
-        return await self._client.command("/ip/dns/cache/print")
+        return await self._read("/ip/dns/cache/print")
 
     async def flush_dns_cache(self):
         await self._client.command("/ip/dns/cache/flush")
@@ -362,7 +523,7 @@ class RouterROS6(RouterBase):
     # ─── NTP ──────────────────────────────────────────────────────────────────
 
     async def get_ntp_client(self) -> dict:
-        r = await self._client.command_one("/system/ntp/client/print")
+        r = await self._read_one("/system/ntp/client/print")
         return r or {}
 
     async def set_ntp_servers(self, primary: str, secondary: str = ""):
@@ -374,7 +535,7 @@ class RouterROS6(RouterBase):
     # ─── Users ────────────────────────────────────────────────────────────────
 
     async def get_users(self) -> list[dict]:
-        return await self._client.command("/user/print")
+        return await self._read("/user/print")
 
     async def add_user(self, name: str, password: str, group: str = "read") -> str:
         r = await self._client.command("/user/add", {
@@ -383,7 +544,7 @@ class RouterROS6(RouterBase):
         return r[0].get("ret", "") if r else ""
 
     async def remove_user(self, id_: str):
-        await self._client.command("/user/remove", {"numbers": id_})
+        await self._client.command_words("/user/remove", f"=numbers={id_}")
 
     # ─── Tools ────────────────────────────────────────────────────────────────
 
@@ -406,19 +567,19 @@ class RouterROS6(RouterBase):
     # ─── IP Pools ─────────────────────────────────────────────────────────────
 
     async def get_ip_pools(self) -> list[dict]:
-        return await self._client.command("/ip/pool/print")
+        return await self._read("/ip/pool/print")
 
     async def add_ip_pool(self, name: str, ranges: str) -> str:
         r = await self._client.command("/ip/pool/add", {"name": name, "ranges": ranges})
         return r[0].get("ret", "") if r else ""
 
     async def remove_ip_pool(self, id_: str):
-        await self._client.command("/ip/pool/remove", {"numbers": id_})
+        await self._client.command_words("/ip/pool/remove", f"=numbers={id_}")
 
     # ─── Queues / QoS ─────────────────────────────────────────────────────────
 
     async def get_simple_queues(self) -> list[dict]:
-        return await self._client.command("/queue/simple/print")
+        return await self._read("/queue/simple/print")
 
     async def add_simple_queue(self, name: str, target: str, max_limit: str = "0/0", comment: str = "") -> str:
         params = {"name": name, "target": target, "max-limit": max_limit}
@@ -428,25 +589,25 @@ class RouterROS6(RouterBase):
         return r[0].get("ret", "") if r else ""
 
     async def remove_simple_queue(self, id_: str):
-        await self._client.command("/queue/simple/remove", {"numbers": id_})
+        await self._client.command_words("/queue/simple/remove", f"=numbers={id_}")
 
     async def enable_simple_queue(self, id_: str):
-        await self._client.command("/queue/simple/enable", {"numbers": id_})
+        await self._client.command_words("/queue/simple/enable", f"=numbers={id_}")
 
     async def disable_simple_queue(self, id_: str):
-        await self._client.command("/queue/simple/disable", {"numbers": id_})
+        await self._client.command_words("/queue/simple/disable", f"=numbers={id_}")
 
     # ─── Hotspot ──────────────────────────────────────────────────────────────
 
     async def get_hotspot_users(self) -> list[dict]:
         try:
-            return await self._client.command("/ip/hotspot/user/print")
+            return await self._read("/ip/hotspot/user/print")
         except APIError:
             return []
 
     async def get_hotspot_active(self) -> list[dict]:
         try:
-            return await self._client.command("/ip/hotspot/active/print")
+            return await self._read("/ip/hotspot/active/print")
         except APIError:
             return []
 
@@ -461,11 +622,11 @@ class RouterROS6(RouterBase):
             raise e
 
     async def remove_hotspot_user(self, id_: str):
-        await self._client.command("/ip/hotspot/user/remove", {"numbers": id_})
+        await self._client.command_words("/ip/hotspot/user/remove", f"=numbers={id_}")
 
     async def disconnect_hotspot_user(self, id_: str):
         try:
-            await self._client.command("/ip/hotspot/active/remove", {"numbers": id_})
+            await self._client.command_words("/ip/hotspot/active/remove", f"=numbers={id_}")
         except APIError:
             pass
 
@@ -473,13 +634,13 @@ class RouterROS6(RouterBase):
 
     async def get_scripts(self) -> list[dict]:
         try:
-            return await self._client.command("/system/script/print")
+            return await self._read("/system/script/print")
         except APIError:
             return []
 
     async def run_script(self, name: str) -> str:
         try:
-            await self._client.command("/system/script/run", {"number": name})
+            await self._client.command_words("/system/script/run", f"=number={name}")
             return "ok"
         except APIError as e:
             raise e
@@ -495,7 +656,7 @@ class RouterROS6(RouterBase):
 
     async def get_certificates(self) -> list[dict]:
         try:
-            return await self._client.command("/certificate/print")
+            return await self._read("/certificate/print")
         except APIError:
             return []
 
@@ -503,13 +664,13 @@ class RouterROS6(RouterBase):
 
     async def get_bridges(self) -> list[dict]:
         try:
-            return await self._client.command("/interface/bridge/print")
+            return await self._read("/interface/bridge/print")
         except APIError:
             return []
 
     async def get_bridge_ports(self) -> list[dict]:
         try:
-            return await self._client.command("/interface/bridge/port/print")
+            return await self._read("/interface/bridge/port/print")
         except APIError:
             return []
 
@@ -520,13 +681,13 @@ class RouterROS6(RouterBase):
         return r[0].get("ret", "") if r else ""
 
     async def remove_bridge_port(self, id_: str):
-        await self._client.command("/interface/bridge/port/remove", {"numbers": id_})
+        await self._client.command_words("/interface/bridge/port/remove", f"=numbers={id_}")
 
     # ─── VLANs ────────────────────────────────────────────────────────────────
 
     async def get_vlans(self) -> list[dict]:
         try:
-            return await self._client.command("/interface/vlan/print")
+            return await self._read("/interface/vlan/print")
         except APIError:
             return []
 
@@ -537,25 +698,25 @@ class RouterROS6(RouterBase):
         return r[0].get("ret", "") if r else ""
 
     async def remove_vlan(self, id_: str):
-        await self._client.command("/interface/vlan/remove", {"numbers": id_})
+        await self._client.command_words("/interface/vlan/remove", f"=numbers={id_}")
 
     # ─── NAT Extended ─────────────────────────────────────────────────────────
 
     async def remove_firewall_nat(self, id_: str):
-        await self._client.command("/ip/firewall/nat/remove", {"numbers": id_})
+        await self._client.command_words("/ip/firewall/nat/remove", f"=numbers={id_}")
 
     async def add_firewall_mangle(self, params: dict) -> str:
         r = await self._client.command("/ip/firewall/mangle/add", params)
         return r[0].get("ret", "") if r else ""
 
     async def remove_firewall_mangle(self, id_: str):
-        await self._client.command("/ip/firewall/mangle/remove", {"numbers": id_})
+        await self._client.command_words("/ip/firewall/mangle/remove", f"=numbers={id_}")
 
     # ─── PPP Profiles ─────────────────────────────────────────────────────────
 
     async def get_ppp_profiles(self) -> list[dict]:
         try:
-            return await self._client.command("/ppp/profile/print")
+            return await self._read("/ppp/profile/print")
         except APIError:
             return []
 
@@ -563,6 +724,6 @@ class RouterROS6(RouterBase):
 
     async def get_interface_ethernet_stats(self) -> list[dict]:
         try:
-            return await self._client.command("/interface/ethernet/print")
+            return await self._read("/interface/ethernet/print")
         except APIError:
             return []
@@ -21,7 +21,7 @@ import logging
 import os
 from typing import AsyncIterator
 
-from .router_ros6 import RouterROS6
+from .router_ros6 import RouterROS6, _ttl_cache
 from .router_client import APIError
 
 log = logging.getLogger("ROS7")
@@ -69,7 +69,7 @@ class RouterROS7(RouterROS6):
     async def get_system_health(self) -> dict:
         """ROS7 uses /system/health/print differently on some boards."""
         try:
-            results = await self._client.command("/system/health/print")
+            results = await self._read("/system/health/print")
             if results:
                 # ROS7 returns list of {name, value, type}
                 if isinstance(results[0], dict) and "name" in results[0]:
@@ -81,15 +81,16 @@ class RouterROS7(RouterROS6):
 
     # ─── Routing (ROS7 uses /ip/route for static, /routing/ for dynamic) ──────
 
+    @_ttl_cache()
     async def get_routes(self) -> list[dict]:
         """ROS7: /ip/route/print still works for IPv4 static routes."""
-        routes = await self._client.command("/ip/route/print")
+        routes = await self._read("/ip/route/print")
         # Also get IPv6 routes
         try:
-            ipv6 = await self._client.command("/ipv6/route/print")
+            ipv6 = await self._read("/ipv6/route/print")
             for r in ipv6:
                 r["_ipv6"] = True
-            routes.extend(ipv6)
+            routes = routes + ipv6  # don't extend the shared read in place
         except APIError:
             pass
         return routes
@@ -98,13 +99,13 @@ class RouterROS7(RouterROS6):
 
     async def get_wireguard_interfaces(self) -> list[dict]:
         try:
-            return await self._client.command("/interface/wireguard/print")
+            return await self._read("/interface/wireguard/print")
         except APIError:
             return []
 
     async def get_wireguard_peers(self) -> list[dict]:
         try:
-            return await self._client.command("/interface/wireguard/peers/print")
+            return await self._read("/interface/wireguard/peers/print")
         except APIError:
             return []
 
@@ -145,19 +146,19 @@ class RouterROS7(RouterROS6):
             raise e
 
     async def remove_wireguard_peer(self, id_: str):
-        await self._client.command("/interface/wireguard/peers/remove", {"numbers": id_})
+        await self._client.command_words("/interface/wireguard/peers/remove", f"=numbers={id_}")
 
     # ─── ROS7 Scripts (uses /system/script same path, but supports more features) ─
 
     async def get_scripts(self) -> list[dict]:
         try:
-            return await self._client.command("/system/script/print")
+            return await self._read("/system/script/print")
         except APIError:
             return []
 
     async def run_script(self, name: str) -> str:
         try:
-            await self._client.command("/system/script/run", {"number": name})
+            await self._client.command_words("/system/script/run", f"=number={name}")
             return "ok"
         except APIError as e:
             raise e
@@ -166,16 +167,16 @@ class RouterROS7(RouterROS6):
 
     async def get_bgp_peers(self) -> list[dict]:
         try:
-            return await self._client.command("/routing/bgp/peer/print")
+            return await self._read("/routing/bgp/peer/print")
         except APIError:
             try:
-                return await self._client.command("/routing/bgp/connection/print")
+                return await self._read("/routing/bgp/connection/print")
             except APIError:
                 return []
 
     async def get_ospf_instances(self) -> list[dict]:
         try:
-            return await self._client.command("/routing/ospf/instance/print")
+            return await self._read("/routing/ospf/instance/print")
         except APIError:
             return []
 
@@ -183,13 +184,13 @@ class RouterROS7(RouterROS6):
 
     async def get_ipv6_addresses(self) -> list[dict]:
         try:
-            return await self._client.command("/ipv6/address/print")
+            return await self._read("/ipv6/address/print")
         except APIError:
             return []
 
     async def get_ipv6_neighbors(self) -> list[dict]:
         try:
-            return await self._client.command("/ipv6/neighbor/print")
+            return await self._read("/ipv6/neighbor/print")
         except APIError:
             return []
 
@@ -197,37 +198,37 @@ class RouterROS7(RouterROS6):
 
     async def get_container_list(self) -> list[dict]:
         try:
-            return await self._client.command("/container/print")
+            return await self._read("/container/print")
         except APIError:
             return []
 
     async def start_container(self, id_: str):
         try:
-            await self._client.command("/container/start", {"numbers": id_})
+            await self._client.command_words("/container/start", f"=numbers={id_}")
         except APIError as e:
             raise e
 
     async def stop_container(self, id_: str):
         try:
-            await self._client.command("/container/stop", {"numbers": id_})
+            await self._client.command_words("/container/stop", f"=numbers={id_}")
         except APIError as e:
             raise e
 
     async def remove_container(self, id_: str):
         try:
-            await self._client.command("/container/remove", {"numbers": id_})
+            await self._client.command_words("/container/remove", f"=numbers={id_}")
         except APIError as e:
             raise e
 
     async def get_container_envs(self, id_: str) -> list[dict]:
         try:
-            return await self._client.command("/container/envs/print", {"numbers": id_})
+            return await self._client.command_words("/container/envs/print", f"=numbers={id_}")
         except APIError:
             return []
 
     async def get_container_mounts(self) -> list[dict]:
         try:
-            return await self._client.command("/container/mounts/print")
+            return await self._read("/container/mounts/print")
         except APIError:
             return []
 
@@ -235,7 +236,7 @@ class RouterROS7(RouterROS6):
 
     async def get_ipv6_firewall_filter(self) -> list[dict]:
         try:
-            return await self._client.command("/ipv6/firewall/filter/print")
+            return await self._read("/ipv6/firewall/filter/print")
         except APIError:
             return []
 
@@ -243,7 +244,7 @@ class RouterROS7(RouterROS6):
 
     async def get_bgp_connections(self) -> list[dict]:
         try:
-            return await self._client.command("/routing/bgp/connection/print")
+            return await self._read("/routing/bgp/connection/print")
         except APIError:
             return []
 
@@ -271,17 +272,18 @@ class RouterROS7(RouterROS6):
 
     async def get_bridge_vlans(self) -> list[dict]:
         try:
-            return await self._client.command("/interface/bridge/vlan/print")
+            return await self._read("/interface/bridge/vlan/print")
         except APIError:
             return []
 
     # ─── Scheduler ────────────────────────────────────────────────────────────
 
     async def get_scheduler_entries(self) -> list[dict]:
-        return await self._client.command("/system/scheduler/print")
+        return await self._read("/system/scheduler/print")
 
     # ─── WiFi (wifi-qcom / wifiwave2 — ROS7 new wireless package) ────────────
 
+    @_ttl_cache()
     async def get_wireless_interfaces(self) -> list[dict]:
         """
         ROS7 supports two wireless stacks:
@@ -290,7 +292,7 @@ class RouterROS7(RouterROS6):
         Try new stack first, fall back to legacy.
         """
         try:
-            result = await self._client.command("/interface/wifi/print")
+            result = await self._read("/interface/wifi/print")
             if result:
                 # Normalize field names to match legacy format expected by formatters
                 normalized = []
@@ -304,19 +306,19 @@ class RouterROS7(RouterROS6):
             pass
         # Fall back to legacy wireless
         try:
-            return await self._client.command("/interface/wireless/print")
+            return await self._read("/interface/wireless/print")
         except Exception:
             return []
 
     async def get_wireless_registrations(self) -> list[dict]:
         """Connected clients — try new wifi stack first, then legacy."""
         try:
-            result = await self._client.command("/interface/wifi/registration-table/print")
+            result = await self._read("/interface/wifi/registration-table/print")
             if result:
                 return result
         except Exception:
             pass
         try:
-            return await self._client.command("/interface/wireless/registration-table/print")
+            return await self._read("/interface/wireless/registration-table/print")
         except Exception:
             return []
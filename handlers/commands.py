@@ -150,9 +150,8 @@ async def cmd_status(msg: Message):
         if active_r:
             lines.append("")
             try:
-                res = await active_r.get_system_resource()
-                identity = await active_r.get_system_identity()
-                name = identity.get("name", "?")
+                snap = await active_r.snapshot(("resource", "identity"))
+                res, name = snap["resource"], snap["identity"]
                 cpu = res.get("cpu-load", "?")
                 mem_used = int(res.get("total-memory", 0)) - int(res.get("free-memory", 0))
                 mem_total = int(res.get("total-memory", 1))
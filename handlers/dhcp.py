@@ -46,8 +46,7 @@ async def dhcp_lease_detail(cb: CallbackQuery):
     r = await require_router(cb, ctx.rm)
     if not r:
         return
-    leases = await r.get_dhcp_leases()
-    lease = next((l for l in leases if l.get(".id") == lease_id), None)
+    lease = await r.get_dhcp_lease(lease_id)
     if not lease:
         await cb.answer("Lease not found.", show_alert=True)
         return
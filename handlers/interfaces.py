@@ -31,8 +31,8 @@ async def iface_detail(cb: CallbackQuery):
     if not iface:
         await cb.answer("Interface not found.", show_alert=True)
         return
-    running = iface.get("running", "false") == "true"
-    disabled = iface.get("disabled", "false") == "true"
+    running = iface.get("running", False)
+    disabled = iface.get("disabled", False)
     await send_or_edit(cb, fmt.fmt_interface_detail(iface), kb.interface_detail_menu(name, running, disabled))
 
 
@@ -49,11 +49,11 @@ async def iface_traffic(cb: CallbackQuery):
     t = await r.get_interface_traffic(name)
     text = fmt.fmt_traffic(t)
     ifaces = await r.get_interfaces()
-    iface = next((i for i in ifaces if i.get("name") == name), {"disabled": "false", "running": "true"})
+    iface = next((i for i in ifaces if i.get("name") == name), {})
     await send_or_edit(cb, text, kb.interface_detail_menu(
         name,
-        iface.get("running", "true") == "true",
-        iface.get("disabled", "false") == "true",
+        iface.get("running", True),
+        iface.get("disabled", False),
     ))
 
 
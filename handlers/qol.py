@@ -125,7 +125,7 @@ async def _do_search(source: Message, query: str):
             if (q in i.get("name", "").lower() or
                     q in i.get("mac-address", "").lower() or
                     q in i.get("comment", "").lower()):
-                status = "🟢" if i.get("running") == "true" else "🔴"
+                status = "🟢" if i.get("running") else "🔴"
                 results.append(f"🔌 *Interface*: {status} `{i.get('name', '?')}` [{i.get('type', '?')}]")
     except Exception:
         pass
@@ -177,8 +177,8 @@ async def health_card(cb: CallbackQuery):
         return
     await cb.answer("📊 Loading…")
 
-    res = await r.get_system_resource()
-    identity = await r.get_system_identity()
+    snap = await r.snapshot(("resource", "identity"))
+    res, identity = snap["resource"], snap["identity"]
 
     cpu = int(res.get("cpu-load", 0))
     mem_free = int(res.get("free-memory", 0))
@@ -312,14 +312,9 @@ async def qol_bulk_disable_fw_confirm(cb: CallbackQuery):
         return
     await cb.answer("⚠️ Disabling all rules…")
     rules = await r.get_firewall_filter()
-    count = 0
-    for rule in rules:
-        if rule.get("disabled", "false") != "true":
-            try:
-                await r.disable_firewall_rule(rule[".id"])
-                count += 1
-            except Exception:
-                pass
+    count = await r.disable_firewall_rules(
+        [rule[".id"] for rule in rules if rule.get("disabled", "false") != "true"]
+    )
     await send_or_edit(
         cb,
         f"✅ *Done!* Disabled {count} firewall rule(s).\n\nUse Firewall → Filter Rules to re-enable.",
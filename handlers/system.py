@@ -17,10 +17,10 @@ async def menu_system(cb: CallbackQuery):
     r = await require_router(cb, ctx.rm)
     if not r:
         return
-    res = await r.get_system_resource()
-    identity = await r.get_system_identity()
-    health = await r.get_system_health()
-    await send_or_edit(cb, fmt.fmt_system(res, identity, health), kb.system_menu())
+    snap = await r.snapshot(("resource", "identity", "health"))
+    await send_or_edit(
+        cb, fmt.fmt_system(snap["resource"], snap["identity"], snap["health"]), kb.system_menu(),
+    )
 
 
 @router.callback_query(F.data == "sys:health")
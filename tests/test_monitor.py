@@ -0,0 +1,92 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("aiogram")
+pytest.importorskip("cryptography")
+
+from core import monitor
+from core.monitor import FLAP_COUNT, FLAP_QUIET, FLAP_WINDOW, Monitor
+
+
+class FakeRouter:
+    def __init__(self):
+        self.running = True
+
+    async def get_monitor_snapshot(self) -> dict:
+        return {
+            "resource": {"cpu-load": "1", "total-memory": "100", "free-memory": "90"},
+            "interfaces": [{"name": "ether1", "running": self.running, "disabled": False}],
+            "leases": None,
+        }
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(monitor, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def poll(m: Monitor, router: FakeRouter, clock: list, at: float, running: bool) -> list[str]:
+    """One poll at time `at`; returns the alerts it raised."""
+    clock[0] = at
+    router.running = running
+    asyncio.run(m._poll_router(1, "home", router, "10.0.0.1"))
+    return m._pending_alerts.pop(1, [])
+
+
+def flip_until_flapping(m: Monitor, router: FakeRouter, clock: list) -> list[list[str]]:
+    return [
+        poll(m, router, clock, at=10.0 * i, running=i % 2 == 1)
+        for i in range(FLAP_COUNT)
+    ]
+
+
+def test_flap_count_within_window_marks_flapping(clock):
+    m, router = Monitor(None, None, owner_id=1), FakeRouter()
+
+    alerts = flip_until_flapping(m, router, clock)
+
+    for changed in alerts[:-1]:
+        assert len(changed) == 1 and "FLAPPING" not in changed[0]
+    assert len(alerts[-1]) == 1 and "FLAPPING" in alerts[-1][0]
+    assert "ether1" in m._alert_states[1]["home"].iface_flapping
+
+
+def test_changes_spread_beyond_window_are_not_flapping(clock):
+    m, router = Monitor(None, None, owner_id=1), FakeRouter()
+    step = FLAP_WINDOW / (FLAP_COUNT - 1) + 1
+
+    for i in range(FLAP_COUNT):
+        alerts = poll(m, router, clock, at=step * i, running=i % 2 == 1)
+        assert len(alerts) == 1 and "FLAPPING" not in alerts[0]
+    assert not m._alert_states[1]["home"].iface_flapping
+
+
+def test_flapping_interface_is_muted(clock):
+    m, router = Monitor(None, None, owner_id=1), FakeRouter()
+    flip_until_flapping(m, router, clock)
+    t = 10.0 * FLAP_COUNT
+
+    assert poll(m, router, clock, at=t, running=False) == []
+    assert poll(m, router, clock, at=t + 10, running=True) == []
+    assert poll(m, router, clock, at=t + 20, running=True) == []
+
+
+def test_single_stopped_flapping_alert_after_quiet(clock):
+    m, router = Monitor(None, None, owner_id=1), FakeRouter()
+    flip_until_flapping(m, router, clock)
+    last_flip = 10.0 * (FLAP_COUNT - 1)
+
+    assert poll(m, router, clock, at=last_flip + FLAP_QUIET - 1, running=True) == []
+    stable = poll(m, router, clock, at=last_flip + FLAP_QUIET, running=True)
+    assert len(stable) == 1
+    assert "stopped flapping" in stable[0] and "UP" in stable[0]
+    assert poll(m, router, clock, at=last_flip + FLAP_QUIET + 30, running=True) == []
+    assert not m._alert_states[1]["home"].iface_flapping
+
+    # Alerts resume once it is stable again
+    down = poll(m, router, clock, at=last_flip + FLAP_QUIET + 60, running=False)
+    assert len(down) == 1 and "DOWN" in down[0]
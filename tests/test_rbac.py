@@ -0,0 +1,69 @@
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("aiogram")
+
+from core import rbac
+from core.rbac import RBACManager, Role
+
+
+@pytest.fixture
+def rbac_files(tmp_path, monkeypatch):
+    snapshot = tmp_path / "rbac.json"
+    wal = tmp_path / "rbac.wal"
+    monkeypatch.setattr(rbac, "RBAC_FILE", snapshot)
+    monkeypatch.setattr(rbac, "RBAC_WAL", wal)
+    return snapshot, wal
+
+
+def test_wal_replays_over_snapshot(rbac_files):
+    snapshot, wal = rbac_files
+    snapshot.write_text(json.dumps({"owner_id": 1, "roles": {"1": "owner", "2": "viewer", "3": "admin"}}))
+    wal.write_text(
+        json.dumps({"op": "set", "uid": 2, "role": "operator"}) + "\n"
+        + json.dumps({"op": "remove", "uid": 3}) + "\n"
+    )
+
+    m = RBACManager()
+
+    assert m.get_role(1) is Role.OWNER
+    assert m.get_role(2) is Role.OPERATOR
+    assert m.get_role(3) is None
+
+
+def test_torn_final_line_then_append(rbac_files):
+    _, wal = rbac_files
+    wal.write_text(
+        json.dumps({"op": "owner", "uid": 1}) + "\n"
+        + '{"op": "set", "uid": 2, "ro'
+    )
+
+    m = RBACManager()
+    assert m.get_role(1) is Role.OWNER
+    assert m.get_role(2) is None
+
+    asyncio.run(m.set_role(4, Role.ADMIN))
+
+    reloaded = RBACManager()
+    assert reloaded.get_role(1) is Role.OWNER
+    assert reloaded.get_role(4) is Role.ADMIN
+
+
+def test_compaction_then_reload(rbac_files, monkeypatch):
+    snapshot, wal = rbac_files
+    monkeypatch.setattr(rbac, "WAL_COMPACT_BYTES", 100)
+    m = RBACManager()
+
+    async def mutate():
+        await m.bootstrap_owner(1)
+        for uid in range(2, 12):
+            await m.set_role(uid, Role.OPERATOR)
+        await m.remove_user(5)
+
+    asyncio.run(mutate())
+
+    assert snapshot.exists()
+    assert wal.stat().st_size < 100
+    assert RBACManager().get_all_users() == m.get_all_users()
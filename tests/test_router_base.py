@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+
+from core.router_base import batch_by_time
+
+
+def test_batch_by_time_bounds_rows_buffered_for_slow_consumer():
+    produced = 0
+
+    async def source():
+        nonlocal produced
+        while True:
+            produced += 1
+            yield {"n": produced}
+            await asyncio.sleep(0)
+
+    async def run():
+        batches = batch_by_time(source(), max_batch=10, window=1.0, max_buffered=30)
+        taken = len(await anext(batches))
+        # A slow consumer: the source keeps flowing while nobody reads
+        for _ in range(200):
+            await asyncio.sleep(0)
+        backlog = produced - taken
+        await batches.aclose()
+        return backlog
+
+    backlog = asyncio.run(run())
+    # 30 queued plus the row the pump holds while waiting for room
+    assert backlog <= 31
+
+
+def test_batch_by_time_cuts_full_batches():
+    async def source():
+        for n in range(25):
+            yield {"n": n}
+
+    async def run():
+        return [[row["n"] for row in batch] async for batch in batch_by_time(source(), max_batch=10)]
+
+    assert asyncio.run(run()) == [list(range(10)), list(range(10, 20)), list(range(20, 25))]
+
+
+def test_batch_by_time_yields_partial_batch_after_window():
+    async def run():
+        more = asyncio.Event()
+
+        async def source():
+            yield {"n": 0}
+            yield {"n": 1}
+            await more.wait()  # the router goes quiet
+            yield {"n": 2}
+
+        loop = asyncio.get_running_loop()
+        batches = batch_by_time(source(), max_batch=10, window=0.05)
+        start = loop.time()
+        first = await anext(batches)
+        waited = loop.time() - start
+        more.set()
+        rest = [batch async for batch in batches]
+        return first, waited, rest
+
+    first, waited, rest = asyncio.run(run())
+    assert first == [{"n": 0}, {"n": 1}]
+    assert 0.04 <= waited < 1.0
+    assert rest == [[{"n": 2}]]
+
+
+def test_batch_by_time_raises_source_error_after_rows():
+    async def source():
+        yield {"n": 0}
+        raise ConnectionError("lost")
+
+    async def run():
+        seen = []
+        with pytest.raises(ConnectionError):
+            async for batch in batch_by_time(source(), window=0.05):
+                seen.append(batch)
+        return seen
+
+    assert asyncio.run(run()) == [[{"n": 0}]]
+
+
+def test_batch_by_time_cancel_closes_source():
+    async def run():
+        started = asyncio.Event()
+        closed = asyncio.Event()
+
+        async def source():
+            try:
+                yield {"n": 0}
+                started.set()
+                await asyncio.Event().wait()
+                yield {"n": 1}
+            finally:
+                closed.set()  # e.g. RouterAPIClient.stream() sending /cancel
+
+        async def consume():
+            async for _ in batch_by_time(source(), window=60.0):
+                pass
+
+        task = asyncio.create_task(consume())
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # The pump was awaited, so the source is closed by the time we return
+        return closed.is_set()
+
+    assert asyncio.run(run())
@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from core.api_protocol import build_sentence
+from core.router_client import _RECV_BUF, APIError, RouterAPIClient, _RouterProtocol
+
+
+class FakeTransport:
+    """Pauses writing once a write fills it, like a full kernel buffer."""
+
+    def __init__(self, protocol: _RouterProtocol):
+        self.protocol = protocol
+        self.closing = False
+        self.written: list[bytes] = []
+
+    def is_closing(self) -> bool:
+        return self.closing
+
+    def write(self, data: bytes) -> None:
+        self.written.append(data)
+        self.protocol.pause_writing()
+
+
+def connected_client() -> tuple[RouterAPIClient, FakeTransport]:
+    client = RouterAPIClient("192.0.2.1", "admin", "")
+    client._protocol = _RouterProtocol(client, client._conn_gen)
+    client._transport = transport = FakeTransport(client._protocol)
+    return client, transport
+
+
+def test_command_batch_survives_disconnect_mid_batch():
+    async def run():
+        client = RouterAPIClient("192.0.2.1", "admin", "")
+
+        async def send_raw(data: bytes):
+            # The connection drops right after the batch is written
+            client._on_connection_lost(client._conn_gen, ConnectionError("reset"))
+
+        client._send_raw = send_raw
+        return await client.command_batch([
+            ("/interface/print", None),
+            ("/ip/address/print", None),
+            ("/system/resource/print", None),
+        ])
+
+    results = asyncio.run(run())
+    assert len(results) == 3
+    assert all(isinstance(r, APIError) for r in results)
+
+
+def test_send_raw_drain_sees_its_own_write():
+    async def run():
+        client, transport = connected_client()
+        send = asyncio.ensure_future(client._send_raw(b"data"))
+        for _ in range(5):
+            await asyncio.sleep(0)
+        # The write paused the transport, so the sender waits on drain
+        blocked = not send.done()
+        client._protocol.resume_writing()
+        await send
+        return blocked, transport.written
+
+    blocked, written = asyncio.run(run())
+    assert blocked
+    assert written == [b"data"]
+
+
+def test_send_raw_raises_when_closed_before_flush():
+    async def run():
+        client, transport = connected_client()
+        send = asyncio.ensure_future(client._send_raw(b"data"))
+        await asyncio.sleep(0)  # enqueued, flush not run yet
+        transport.closing = True
+        with pytest.raises(ConnectionError):
+            await send
+        return transport.written
+
+    assert asyncio.run(run()) == []
+
+
+def test_receive_buffer_shrinks_after_large_reply():
+    async def run():
+        client, _ = connected_client()
+        tag = client._next_tag()
+        slot = client._pending[tag] = client._rows_slot()
+        data = build_sentence(["!re", "=data=" + "x" * 300_000, f".tag={tag}"])
+        data += build_sentence(["!done", f".tag={tag}"])
+        protocol = client._protocol
+        while data:
+            space = protocol.get_buffer(-1)
+            n = min(len(space), len(data))
+            space[:n] = data[:n]
+            data = data[n:]
+            protocol.buffer_updated(n)
+        grown_to_fit = len(slot.fut.result()[0]["data"]) == 300_000
+        return grown_to_fit, len(client._buf)
+
+    grown_to_fit, size = asyncio.run(run())
+    assert grown_to_fit
+    assert size == _RECV_BUF
@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+
+from core.router_client import APIError
+from core.router_ros6 import RouterROS6
+
+
+def test_read_after_write_does_not_join_older_print():
+    async def run():
+        router = RouterROS6("192.0.2.1", "admin", "")
+        client = router._client
+        state = {"disabled": "false"}
+        sent = []
+        release_first = asyncio.Event()
+
+        async def command(path, params=None, queries=None, proplist=None):
+            # Snapshot when the /print is sent, like the router would
+            rows = [{"name": "ether1", "running": "true", **state}]
+            sent.append(path)
+            if len(sent) == 1:
+                await release_first.wait()
+            return rows
+
+        async def command_words(path, *words):
+            state["disabled"] = "true"
+            client.on_write(path)
+
+        client.command = command
+        client.command_words = command_words
+
+        before = asyncio.ensure_future(router.get_interfaces())
+        while not sent:
+            await asyncio.sleep(0)
+        await router.disable_interface("ether1")
+        after = asyncio.ensure_future(router.get_interfaces())
+        for _ in range(5):
+            await asyncio.sleep(0)
+        release_first.set()
+        return await before, await after, sent
+
+    before, after, sent = asyncio.run(run())
+    assert before[0]["disabled"] is False
+    assert after[0]["disabled"] is True
+    assert len(sent) == 2
+
+
+def test_get_logs_limit_matches_tail_slice():
+    rows = [{"message": str(i)} for i in range(5)]
+
+    async def run(limit):
+        router = RouterROS6("192.0.2.1", "admin", "")
+
+        async def stream(path, params=None, queries=None):
+            for row in rows:
+                yield row
+
+        router._client.stream = stream
+        return await router.get_logs(limit=limit)
+
+    for limit in (3, 0, -2, 10):
+        assert asyncio.run(run(limit)) == rows[-limit:]
+
+
+def bulk_router(fail: dict[str, Exception]) -> tuple[RouterROS6, list[str]]:
+    """Router whose batch command is refused; per-id commands fail as in `fail`."""
+    router = RouterROS6("192.0.2.1", "admin", "")
+    applied = []
+
+    async def command_words(path, word):
+        id_ = word.removeprefix("=numbers=")
+        if "," in id_:
+            raise APIError("no such item")
+        if id_ in fail:
+            raise fail[id_]
+        applied.append(id_)
+
+    router._client.command_words = command_words
+    return router, applied
+
+
+def test_bulk_skips_refused_ids():
+    router, applied = bulk_router({"*2": APIError("no such item")})
+
+    count = asyncio.run(router.remove_firewall_rules(["*1", "*2", "*3"]))
+
+    assert count == 2
+    assert applied == ["*1", "*3"]
+
+
+def test_bulk_returns_partial_count_when_connection_drops():
+    router, applied = bulk_router({"*3": ConnectionError("lost")})
+
+    count = asyncio.run(router.remove_firewall_rules(["*1", "*2", "*3", "*4"]))
+
+    assert count == 2
+    assert applied == ["*1", "*2"]
+
+
+def test_bulk_raises_when_connection_drops_before_any_applied():
+    router, _ = bulk_router({"*1": ConnectionError("lost")})
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(router.remove_firewall_rules(["*1", "*2"]))
@@ -102,8 +102,8 @@ def fmt_interfaces(interfaces: list[dict]) -> str:
     lines = ["🔌 *Interfaces*\n"]
     for iface in interfaces:
         name = iface.get("name", "?")
-        running = iface.get("running", "false") == "true"
-        disabled = iface.get("disabled", "false") == "true"
+        running = iface.get("running", False)
+        disabled = iface.get("disabled", False)
         rx = _fmt_bytes(iface.get("rx-byte", 0))
         tx = _fmt_bytes(iface.get("tx-byte", 0))
         mac = iface.get("mac-address", "")
@@ -121,8 +121,8 @@ def fmt_interfaces(interfaces: list[dict]) -> str:
 def fmt_interface_detail(iface: dict) -> str:
     name = iface.get("name", "?")
     type_ = iface.get("type", "?")
-    running = iface.get("running", "false") == "true"
-    disabled = iface.get("disabled", "false") == "true"
+    running = iface.get("running", False)
+    disabled = iface.get("disabled", False)
     mtu = iface.get("mtu", "?")
     rx = _fmt_bytes(iface.get("rx-byte", 0))
     tx = _fmt_bytes(iface.get("tx-byte", 0))
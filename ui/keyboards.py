@@ -86,8 +86,8 @@ def interfaces_menu(interfaces: list[dict]) -> InlineKeyboardMarkup:
     builder = InlineKeyboardBuilder()
     for iface in interfaces:
         name = iface.get("name", "?")
-        running = iface.get("running", "false") == "true"
-        disabled = iface.get("disabled", "false") == "true"
+        running = iface.get("running", False)
+        disabled = iface.get("disabled", False)
         icon = "🟢" if running else ("⛔" if disabled else "🔴")
         builder.row(
             InlineKeyboardButton(text=f"{icon} {name}", callback_data=f"iface:detail:{name}"),